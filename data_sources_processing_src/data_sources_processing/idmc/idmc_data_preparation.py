@@ -1,12 +1,33 @@
 import os
 from typing import Any, Dict, Union
 
+import pandas as pd
 from data_sources_processing.utils import _get_hdx_data
 
+# Sheet of the IDMC workbook used by the dashboard
+idmc_sheet_name = "3_IDPs_SADD_estimates"
+
 
 def _get_idmc_data(
     datasets_metadata: Dict[str, Any], data_output_path: os.PathLike
 ) -> Union[Dict[str, Any], None]:
     """IDMC data preparation function, calls the HDX API."""
 
-    return _get_hdx_data(datasets_metadata, data_output_path, "idmc")
+    updated_datasets_metadata = _get_hdx_data(
+        datasets_metadata, data_output_path, "idmc"
+    )
+
+    saved_file_path = os.path.join(
+        data_output_path, "idmc", datasets_metadata["saved_file_name"]
+    )
+    parquet_file_path = f"{os.path.splitext(saved_file_path)[0]}.parquet"
+    # Parquet copy of the used sheet, faster to load in the dashboard than the Excel file
+    if os.path.exists(saved_file_path) and (
+        not os.path.exists(parquet_file_path)
+        or os.path.getmtime(parquet_file_path) < os.path.getmtime(saved_file_path)
+    ):
+        pd.read_excel(saved_file_path, sheet_name=idmc_sheet_name).to_parquet(
+            parquet_file_path, compression="zstd", index=False
+        )
+
+    return updated_datasets_metadata
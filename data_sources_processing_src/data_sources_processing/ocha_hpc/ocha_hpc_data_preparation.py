@@ -27,10 +27,14 @@ def _get_ocha_hpc_data(
 ):
 
     pulled_data = _get_key_pin_informations_all_years()
-    pulled_data.to_csv(
-        os.path.join(
-            data_output_path, "ocha_hpc", datasets_metadata["saved_file_name"]
-        ),
+    saved_file_path = os.path.join(
+        data_output_path, "ocha_hpc", datasets_metadata["saved_file_name"]
+    )
+    pulled_data.to_csv(saved_file_path, index=False)
+    # Parquet copy, faster to load in the dashboard than the CSV file
+    pulled_data.to_parquet(
+        f"{os.path.splitext(saved_file_path)[0]}.parquet",
+        compression="snappy",
         index=False,
     )
     return datasets_metadata
@@ -47,6 +47,14 @@ If you can't find any surely relevant information, provide an empty string. No m
 
 ohchr_data_path = os.path.join("/data", "datasources", "ohchr")
 
+documents_metadata_columns = [
+    "Title",
+    "Symbol/Title",
+    "Submitted Date",
+    "Download Link",
+    "doc_link",
+]
+
 
 def _create_empty_df(indicator: str):
     return pd.DataFrame(
@@ -66,6 +74,31 @@ def _create_empty_df(indicator: str):
     )
 
 
+def _save_parquet_copy(excel_file_path: str):
+    """
+    Inputs:
+        - excel_file_path (str): Path of the final Excel file of one country.
+
+    Operation:
+        1. Read the Excel file the way the dashboard reads it, forward filling the merged index cells.
+        2. Write it to a temporary parquet file, then move it next to the Excel file in one step,
+           so the dashboard never reads a partially written parquet file.
+    """
+    parquet_file_path = f"{os.path.splitext(excel_file_path)[0]}.parquet"
+    tmp_parquet_file_path = f"{parquet_file_path}.tmp"
+    try:
+        pd.read_excel(excel_file_path).ffill().to_parquet(
+            tmp_parquet_file_path, compression="zstd", index=False
+        )
+    except (TypeError, ValueError) as e:
+        # Columns of mixed types: the dashboard reads the Excel file instead
+        logger.warning(f"No parquet copy of {excel_file_path}: {e}")
+        if os.path.exists(tmp_parquet_file_path):
+            os.remove(tmp_parquet_file_path)
+        return
+    os.replace(tmp_parquet_file_path, parquet_file_path)
+
+
 class ResultsGenerator:
     def __init__(
         self,
@@ -81,7 +114,9 @@ class ResultsGenerator:
         self.tags_list = _load_tags()
         self.embeddings_generator = EmbeddingsGenerator()
 
-        self.input_file = _load_preprocess_df(self.input_file_path, n_grouped_sentences)
+        self.documents_df, self.input_file = _load_preprocess_df(
+            self.input_file_path, n_grouped_sentences
+        )
         self.processed_countries = self.input_file["Country"].unique()
 
         self.output_folder_path = os.path.join(ohchr_data_path, "results")
@@ -196,7 +231,8 @@ class ResultsGenerator:
                 d. Prepare messages for ChatGPT based on relevant entries.
             5. Call ChatGPT in bulk to extract relevant information.
             6. Update the final DataFrame with extracted information from ChatGPT responses.
-            7. Return the DataFrame with relevant entries and extracted information.
+            7. Join the documents metadata back on "doc_id".
+            8. Return the DataFrame with relevant entries and extracted information.
         """
 
         df_one_country = df.copy()
@@ -256,6 +292,13 @@ class ResultsGenerator:
 
         final_df["Extracted Infos"] = final_extracted_infos
 
+        final_df = final_df.merge(
+            self.documents_df[documents_metadata_columns],
+            left_on="doc_id",
+            right_index=True,
+            how="left",
+        )
+
         return final_df
 
     def _get_law_summary(self, df: pd.DataFrame, one_indicator: str, one_country: str):
@@ -287,13 +330,7 @@ class ResultsGenerator:
         most_relevant_df = most_relevant_df.explode("Extracted Infos")
 
         most_relevant_df = most_relevant_df.groupby(
-            [
-                "Title",
-                "Symbol/Title",
-                "Submitted Date",
-                "Download Link",
-                "doc_link",
-            ],
+            documents_metadata_columns,
             as_index=False,
         ).agg(
             {
@@ -364,6 +401,7 @@ class ResultsGenerator:
                     ii. Append the summary DataFrame to the final results.
                     iii. Save the results to an Excel file.
                 d. Update progress bar after processing each indicator.
+                e. Save a parquet copy of the final Excel file, read by the dashboard.
         """
 
         n_tot_indicators = len(_flatten_list_of_lists(list(tags_list.values())))
@@ -423,6 +461,10 @@ class ResultsGenerator:
 
                     progress_bar.update(1)
 
+            _save_parquet_copy(
+                os.path.join(self.output_folder_path, f"{one_country}.xlsx")
+            )
+
 
 if __name__ == "__main__":
     args = argparse.ArgumentParser()
@@ -8,13 +8,18 @@ from typing import List
 
 import docx
 import fitz
+import joblib
+import lxml.html
 import pandas as pd
 import pytesseract
 import requests
+import soupsieve
 from bs4 import BeautifulSoup
 from nltk.tokenize import sent_tokenize, word_tokenize
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 tqdm.pandas()
 
@@ -26,6 +31,27 @@ logger = logging.getLogger(__name__)
 
 ohchr_data_path = os.path.join("/data", "datasources", "ohchr")
 
+# Shared session so that the link lookups and the downloads reuse keep-alive connections
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+requests_timeout = 30
+
+# CSS selectors compiled once, used to find the document links in the OHCHR pages
+docx_link_selector = soupsieve.compile('a[id*="Docx"]')
+pdf_link_selector = soupsieve.compile('a[id*="pdf" i]')
+
+# On-disk cache of the document links, so that reruns do not query OHCHR again
+links_memory = joblib.Memory(
+    location=os.path.join(ohchr_data_path, "input_data", "links_cache"), verbose=0
+)
+
 
 def _map_countries(input_country: str) -> str:
     countries_mapping = {
@@ -94,16 +120,22 @@ def get_text_from_link(row: pd.Series, data_file_path: os.PathLike) -> str:
 
     Operations:
         1. Construct the file path for the document based on metadata.
-        2. Download the document if it does not exist locally.
-        3. Extract text from the document based on its type (DOCX or PDF).
-        4. Apply OCR for handwritten PDFs if the initial extraction is empty.
-        5. Combine all extracted text.
-        6. Handle any errors and provide information about the failure.
+        2. Return the cached text if it was already extracted in a previous run.
+        3. Download the document if it does not exist locally.
+        4. Extract text from the document based on its type (DOCX or PDF).
+        5. Apply OCR for handwritten PDFs if the initial extraction is empty.
+        6. Combine all extracted text and cache it next to the document.
+        7. Handle any errors and provide information about the failure.
     """
     doc_type = row["doc_type"]
     file_path = os.path.join(
         data_file_path, f"{row['Symbol/Title'].replace('/', '-')}.{doc_type}"
     )
+    text_file_path = f"{file_path}.txt"
+
+    if os.path.exists(text_file_path):
+        with open(text_file_path, "r", encoding="utf-8") as text_file:
+            return text_file.read()
 
     try:
         if not os.path.exists(file_path):
@@ -128,6 +160,10 @@ def get_text_from_link(row: pd.Series, data_file_path: os.PathLike) -> str:
 
     extracted_text = _get_all_extracted_text(extracted_text)
 
+    if len(extracted_text) > 0:
+        with open(text_file_path, "w", encoding="utf-8") as text_file:
+            text_file.write(extracted_text)
+
     return extracted_text
 
 
@@ -135,8 +171,8 @@ def html_doc2df(html_file_path: os.PathLike = os.path.join("all_crc_reports.html
     """
     Reads an HTML file from the specified path, defaulting to 'all_crc_reports.html' in the "data" directory.
     The file "all_crc_reports.html" is downloaded manually from the OHCHR website.
-    Parses the HTML to extract the contents of the first table it finds, skipping the table's header row.
-    Iterates through the table rows, extracting text from each cell and replacing the text
+    Parses the HTML with lxml to extract the contents of the first table it finds, skipping the table's header row.
+    Iterates once through the table rows, extracting text from each cell and replacing the text
     of the last column with a hyperlink URL if present.
     Compiles the extracted data into a list, with each list item representing a row in the table.
     Constructs a pandas DataFrame from the list, assigning predefined column names that reflect the table's structure.
@@ -145,23 +181,22 @@ def html_doc2df(html_file_path: os.PathLike = os.path.join("all_crc_reports.html
     """
 
     # read html file
-    with open(html_file_path) as html_file:
-        soup = BeautifulSoup(html_file, "html.parser")
+    tree = lxml.html.parse(html_file_path)
 
     # Find the table
-    table = soup.find("table")
+    table = tree.find(".//table")
 
     # Extract rows from the table
-    rows = table.find_all("tr")[1:]  # Skipping the header row
+    rows = table.xpath(".//tr")[1:]  # Skipping the header row
 
     # Extracting the data
     data = []
-    for i, row in enumerate(rows):
-        cols = row.find_all("td")
-        cols = [ele.text.strip() for ele in cols]
+    for row in rows:
+        links = row.xpath(".//a")
         # For the last column (Download), extract the URL instead of text
-        if row.find("a"):
-            cols[-1] = row.find("a").get("href")
+        if links:
+            cols = [ele.text_content().strip() for ele in row.xpath(".//td")]
+            cols[-1] = links[0].get("href")
             data.append(cols)
 
     # Define column names based on the table structure
@@ -180,6 +215,7 @@ def html_doc2df(html_file_path: os.PathLike = os.path.join("all_crc_reports.html
     return df
 
 
+@links_memory.cache
 def _get_link(child_link: str):
     """
     This function constructs a URL by appending a given child_link to a predefined original_parent_link.
@@ -189,22 +225,23 @@ def _get_link(child_link: str):
     If the href doesn't start with "http", it adjusts the link to be a full URL.
     If no "Docx" link is found, it looks for a PDF link instead and updates the doc_type.
     Returns the fully qualified document link and the document type ("docx" or "pdf").
+    Results are cached on disk, so the lookup is only done once per child_link.
     """
     original_parent_link = "https://tbinternet.ohchr.org"
     url = original_parent_link + child_link
 
     # Send a GET request
-    response = requests.get(url)
+    response = session.get(url, timeout=requests_timeout)
     doc_type = "docx"
 
     # Parse the HTML content
     soup = BeautifulSoup(response.text, "html.parser")
-    link = soup.find("a", id=lambda id: id and "Docx" in id).get("href")
+    link = docx_link_selector.select_one(soup).get("href")
     if not link.startswith("http"):
         if link.startswith("/"):
             link = original_parent_link + link
         else:
-            link = soup.find("a", id=lambda id: id and "pdf" in id.lower()).get("href")
+            link = pdf_link_selector.select_one(soup).get("href")
             doc_type = "pdf"
             if link.startswith("/"):
                 link = original_parent_link + link
@@ -223,7 +260,7 @@ def _download_document(doc_url: str, doc_title: str):
     if doc_url == "NOT FOUND":
         return
 
-    response = requests.get(doc_url)
+    response = session.get(doc_url, timeout=requests_timeout)
 
     # Check if the request was successful
     if response.status_code == 200:
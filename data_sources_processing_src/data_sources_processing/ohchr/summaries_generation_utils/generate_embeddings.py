@@ -1,6 +1,5 @@
 from typing import List
 
-import numpy as np
 import torch
 import torch.nn.functional as F
 from torch import Tensor, float16
@@ -55,21 +54,18 @@ class EmbeddingsGenerator:
 
         Operations:
             1. Calculate the number of input texts.
-            2. Convert input texts to a NumPy array.
-            3. Compute sentence lengths and sort indices based on these lengths.
-            4. Sort sentences according to the sorted indices.
-            5. Create an empty tensor for embeddings.
-            6. Generate embeddings for sentences in batches or all at once.
-            7. Place the embeddings in the correct order based on original indices.
-            8. Return the final tensor of embeddings.
+            2. Sort indices based on the sentence lengths.
+            3. Sort sentences according to the sorted indices.
+            4. Create an empty tensor for embeddings.
+            5. Generate embeddings for sentences in batches or all at once.
+            6. Place the embeddings in the correct order based on original indices.
+            7. Return the final tensor of embeddings.
         """
         n_input_texts = len(input_texts)
-        input_sentences = np.array(input_texts)
-        sentences_lengths = np.array(
-            [len(sentence.split()) for sentence in input_texts]
+        sorted_indices = sorted(
+            range(n_input_texts), key=lambda i: len(input_texts[i].split())
         )
-        sorted_indices = np.argsort(sentences_lengths)
-        sorted_sentences = input_sentences[sorted_indices].tolist()
+        sorted_sentences = [input_texts[i] for i in sorted_indices]
 
         sorted_inputs_embeddings = torch.zeros(
             (n_input_texts, self.embedding_size), dtype=float16
@@ -9,6 +9,7 @@ from typing import Dict, List, Literal
 import aiohttp
 import certifi
 import dotenv
+import orjson
 from tqdm import tqdm
 
 logging.basicConfig(
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 env = dotenv.dotenv_values()
 openai_api_key = env["OPENAI_API_KEY"]
 
+# Built once and shared by all requests instead of being recreated per call
+ssl_context = ssl.create_default_context(cafile=certifi.where())
+
 
 def _extract_and_evaluate_first(string):
     """
@@ -27,35 +31,40 @@ def _extract_and_evaluate_first(string):
     - string (str): The input string to search for the first occurrence of '{' or '['.
 
     Outputs:
-    - match (str): The first matched substring enclosed within '{}' or '[]',
+    - match (str): The first balanced substring enclosed within '{}' or '[]',
       or the entire input string if no brackets are found.
 
     Operation:
-    1. Find the index of the first occurrence of '{' in the string.
-    2. Find the index of the first occurrence of '[' in the string.
-    3. Determine which character, '{' or '[', appears first in the string:
-    3.1 If '{' appears before '[' or '[' is not found, extract the content within the first '{}' found in the string.
-    3.2 If '[' appears before '{' or '{' is not found, extract the content within the first '[]' found in the string.
-    3.3 If neither '{' nor '[' is found, return the entire input string.
-    4. Return the extracted matched substring.
+    1. Find the index of the first occurrence of '{' or '[' in the string.
+    2. If neither '{' nor '[' is found, return the entire input string.
+    3. Scan forward from the opening character, tracking the nesting depth of that bracket type.
+    4. Return the substring up to the matching closing character, so nested JSON is kept whole.
+    5. If the brackets are never balanced, return everything from the opening character onwards.
     """
 
     # Find the first occurrence of '{' or '['
-    index_curly = string.find("{")
-    index_square = string.find("[")
-
-    # Determine which character comes first
-    if 0 <= index_curly < index_square or (index_curly != -1 and index_square == -1):
-        # Extract and evaluate content within {}
-        match = re.search(r"\{([^\}]*)\}", string).group(0)
-    elif 0 <= index_square < index_curly or (index_square != -1 and index_curly == -1):
-        # Extract and evaluate content within []
-        match = re.search(r"\[([^\]]*)\]", string).group(0)
-    else:
+    start = min(
+        (string.find("{"), string.find("[")), key=lambda index: (index < 0, index)
+    )
+    if start < 0:
         # No brackets or braces found
-        match = string
+        return string
+
+    opening_char = string[start]
+    closing_char = "}" if opening_char == "{" else "]"
+
+    # Single forward pass tracking the bracket depth
+    depth = 0
+    for i in range(start, len(string)):
+        char = string[i]
+        if char == opening_char:
+            depth += 1
+        elif char == closing_char:
+            depth -= 1
+            if depth == 0:
+                return string[start : i + 1]
 
-    return match
+    return string[start:]
 
 
 def _postprocess_json_string(s):
@@ -75,6 +84,56 @@ def _postprocess_json_string(s):
     return _extract_and_evaluate_first(s)
 
 
+def _fast_extract_content(raw_response: bytes) -> str:
+    """
+    Inputs:
+    - raw_response (bytes): The raw body of an OpenAI chat completion response.
+
+    Outputs:
+    - content (str): The message content of the first choice.
+
+    Operation:
+    1. Parse the response body with orjson, without decoding it to a string first.
+    2. Return the message content of the first choice, the only part of the response that is used.
+    """
+    return orjson.loads(raw_response)["choices"][0]["message"]["content"]
+
+
+def _parse_extraction_output(output_text: str):
+    """
+    Inputs:
+    - output_text (str): The message content of an extraction response.
+
+    Outputs:
+    - extracted_infos (Union[List, Dict]): The evaluated list or dictionary,
+      or an empty list if the output cannot be parsed.
+
+    Operation:
+    1. If the stripped text already starts with '[' or '{', try to evaluate it directly,
+       without the post-processing pass.
+    2. Otherwise, or if that fails, clean the text using `_postprocess_json_string`.
+    3. Evaluate the cleaned text with `literal_eval`, then with `json.loads` if it fails.
+    4. If both fail, log the error and return an empty list.
+    """
+    stripped_text = output_text.strip()
+    if stripped_text.startswith(("[", "{")):
+        try:
+            return literal_eval(stripped_text)
+        except Exception:
+            pass
+
+    output_text = _postprocess_json_string(output_text)
+
+    try:
+        return literal_eval(output_text)
+    except Exception:
+        try:
+            return json.loads(output_text)
+        except Exception as e:
+            logger.error(f"formatting failed.{str(e)}. {output_text}")
+            return []
+
+
 # Call ChatGPT with the given prompt, asynchronously.
 async def call_chatgpt_async(
     semaphore: asyncio.Semaphore,
@@ -102,14 +161,15 @@ async def call_chatgpt_async(
     4. If the request is successful, extract the output text from the response.
     5. If an exception occurs, print the error and set default values based on response_type.
     6. If response_type is "extraction":
-    6.1 Post-process the output text.
-    6.2 Try to evaluate the post-processed text as a Python literal or JSON.
+    6.1 If the output text already starts with '[' or '{', try to evaluate it directly.
+    6.2 Otherwise, post-process the output text and try to evaluate it as a Python literal or JSON.
     6.3 If evaluation fails, set the extracted information to an empty list.
     7. If response_type is "summary", set the extracted information to the output text.
     8. Return the extracted information.
     """
 
     payload = {"model": openai_model_name, "messages": message}
+    raw_response = b""
     async with semaphore:
         try:
             async with session.post(
@@ -119,14 +179,14 @@ async def call_chatgpt_async(
                     "Authorization": f"Bearer {openai_api_key}",
                 },
                 json=payload,
-                ssl=ssl.create_default_context(cafile=certifi.where()),
+                ssl=ssl_context,
             ) as response:
-                clean_response = await response.json()
+                raw_response = await response.read()
 
-                output_text = clean_response["choices"][0]["message"]["content"]
+                output_text = _fast_extract_content(raw_response)
 
         except Exception as e:
-            logger.error(f"GPT running failed. {str(e)} {clean_response}")
+            logger.error(f"GPT running failed. {str(e)} {raw_response}")
             # assert False, "GPT running failed"
             if response_type == "extraction":
                 output_text = "[]"
@@ -134,16 +194,7 @@ async def call_chatgpt_async(
                 output_text = ""
 
         if response_type == "extraction":
-            output_text = _postprocess_json_string(output_text)
-
-            try:
-                gpt_extracted_infos = literal_eval(output_text)
-            except Exception:
-                try:
-                    gpt_extracted_infos = json.loads(output_text)
-                except Exception as e:
-                    logger.error(f"formatting failed.{str(e)}. {output_text}")
-                    gpt_extracted_infos = []
+            gpt_extracted_infos = _parse_extraction_output(output_text)
         else:
             gpt_extracted_infos = output_text
 
@@ -156,7 +207,7 @@ async def call_chatgpt_bulk(
     response_type: Literal["extraction", "summary"],
     openai_model_name: str,
     country: str,
-    rate_limit: int = 1,
+    rate_limit: int = 16,
 ):
     """
     Inputs:
@@ -164,7 +215,7 @@ async def call_chatgpt_bulk(
     - response_type (Literal["extraction", "summary"]): Type of response expected ("extraction" or "summary").
     - openai_model_name (str): The name of the OpenAI model to use.
     - country (str): Name of the country for context in the progress bar description.
-    - rate_limit (int, optional): Maximum number of concurrent requests (default is 1).
+    - rate_limit (int, optional): Maximum number of concurrent requests (default is 16).
 
     Outputs:
     - responses (List): List of responses from the asynchronous calls to ChatGPT.
@@ -183,7 +234,9 @@ async def call_chatgpt_bulk(
 
     assert response_type in ["extraction", "summary"]
     semaphore = asyncio.Semaphore(rate_limit)  # Control concurrency level
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(
+        json_serialize=lambda obj: orjson.dumps(obj).decode()
+    ) as session:
         # Create a tqdm async progress bar
         if response_type == "extraction":
             progress_bar = tqdm(
@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List
+from typing import List, Tuple
 
 import pandas as pd
 from nltk.tokenize import sent_tokenize
@@ -66,11 +66,34 @@ def _load_tags():
 def _load_preprocess_df(
     input_file_path: str,
     n_sentences_per_group: int,
-):
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Inputs:
+        - input_file_path (str): Path to the CSV file with the scraped documents.
+        - n_sentences_per_group (int): Number of sentences in each group.
+
+    Outputs:
+        - Tuple[pd.DataFrame, pd.DataFrame]: The documents DataFrame, and a skinny
+          DataFrame with one row per sentences group, linked to the documents by "doc_id".
+
+    Operations:
+        1. Load the documents DataFrame.
+        2. Split the text of each document into overlapping sentences groups.
+        3. Build the sentences groups DataFrame directly from records, instead of
+           exploding the documents DataFrame and copying all its columns for each group.
+    """
     print("============================= LOAD DATASET =============================")
     loaded_df = pd.read_csv(input_file_path)
-    loaded_df["Sentences Groups"] = loaded_df["extracted_text"].apply(
-        lambda x: _get_sentences_groups(x, n_sentences_per_group=n_sentences_per_group)
+    records = [
+        (row.Index, group_id, row.Country, sentences_group)
+        for row in loaded_df.itertuples()
+        for group_id, sentences_group in enumerate(
+            _get_sentences_groups(
+                row.extracted_text, n_sentences_per_group=n_sentences_per_group
+            )
+        )
+    ]
+    sentences_groups_df = pd.DataFrame(
+        records, columns=["doc_id", "group_id", "Country", "Sentences Groups"]
     )
-    loaded_df = loaded_df.explode("Sentences Groups")
-    return loaded_df
+    return loaded_df, sentences_groups_df
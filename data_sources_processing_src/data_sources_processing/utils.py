@@ -1,11 +1,14 @@
 import logging
 import os
-from copy import copy
+import shutil
 from datetime import datetime
 from typing import Any, Dict, Union
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logging.basicConfig(
     level=logging.DEBUG,  # Set the logging level
@@ -13,6 +16,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared session so that HDX page requests and downloads reuse keep-alive connections,
+# transient errors are retried with an exponential backoff
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+        ),
+    ),
+)
+session.headers.update({"User-Agent": "cpaor-updater/1.0"})
+requests_timeout = (5, 60)
+download_timeout = (5, 300)
+download_chunk_size = 1 << 16
+
+months_numbers = {
+    "January": "01",
+    "February": "02",
+    "March": "03",
+    "April": "04",
+    "May": "05",
+    "June": "06",
+    "July": "07",
+    "August": "08",
+    "September": "09",
+    "October": "10",
+    "November": "11",
+    "December": "12",
+}
+
+
+def _has_class_xpath(class_name: str) -> str:
+    # Matches elements whose class attribute contains exactly class_name
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# XPath expressions compiled once, used to parse the HDX dataset pages
+resource_items_xpath = etree.XPath(f"//li[{_has_class_xpath('resource-item')}]")
+heading_title_xpath = etree.XPath(f"string(.//a[{_has_class_xpath('heading')}]/@title)")
+update_date_xpath = etree.XPath(f"string(.//div[{_has_class_xpath('update-date')}])")
+download_url_xpath = etree.XPath(
+    f"string(.//a[{_has_class_xpath('resource-url-analytics')}]/@href)"
+)
+
 
 def _get_hdx_data(
     original_datasets_metadata: Dict[str, Any],
@@ -32,43 +85,67 @@ def _get_hdx_data(
     Operation:
     1. Create a copy of the original dataset metadata.
     2. Retrieve the URL of the dataset page from the metadata.
-    3. Send a GET request to the URL.
-    4. If the request is successful:
-    4.1 Parse the HTML content of the page.
-    4.2 Extract the latest file information using '_get_hdx_file_infos'.
-    4.3 Compare the extracted file's update date with the stored metadata.
-    4.4 If the dates differ, download the new file and update the metadata with the latest file information.
-    4.5 Return the updated metadata.
-    5. If the request fails, print an error message and return None.
+    3. Send a conditional GET request to the URL, using the stored ETag and Last-Modified headers.
+    4. If the page did not change since the last run (status code 304), return the original metadata.
+    5. If the request is successful:
+    5.1 Store the new ETag and Last-Modified headers in the metadata.
+    5.2 Parse the HTML content of the page.
+    5.3 Extract the latest file information using '_get_hdx_file_infos'.
+    5.4 Compare the extracted file's update date with the stored metadata.
+    5.5 If the dates differ, get the file size and ETag with a HEAD request, download the new file
+        if they differ from the stored ones, and update the metadata with the latest file information.
+    5.6 Return the updated metadata.
+    6. If the request fails, print an error message and return None.
     """
 
-    datasets_metadata = copy(original_datasets_metadata)
+    datasets_metadata = dict(original_datasets_metadata)
     # URL of the dataset page
     url = datasets_metadata["website_url"]
 
+    # Only get the page content if it changed since the last run
+    headers = {}
+    if datasets_metadata.get("http_etag"):
+        headers["If-None-Match"] = datasets_metadata["http_etag"]
+    if datasets_metadata.get("http_last_modified"):
+        headers["If-Modified-Since"] = datasets_metadata["http_last_modified"]
+
     # Send a GET request to the URL
-    response = requests.get(url)
+    response = session.get(url, headers=headers, timeout=requests_timeout)
+
+    if response.status_code == 304:
+        return original_datasets_metadata
 
     # Check if the request was successful
     if response.status_code == 200:
+        datasets_metadata["http_etag"] = response.headers.get("ETag", "")
+        datasets_metadata["http_last_modified"] = response.headers.get(
+            "Last-Modified", ""
+        )
+
         # Parse the HTML content of the page
-        soup = BeautifulSoup(response.content, "html.parser")
+        tree = lxml.html.fromstring(response.content)
 
-        latest_file_info = _get_hdx_file_infos(soup, datasets_metadata["hdx_file_name"])
+        latest_file_info = _get_hdx_file_infos(tree, datasets_metadata["hdx_file_name"])
 
         if (
             latest_file_info["file_time"]
             != datasets_metadata["latest_file_info"]["file_time"]
         ):
-
-            _dl_hdx_file(
-                latest_file_info["download_url"],
-                os.path.join(
-                    data_output_path,
-                    data_folder,
-                    datasets_metadata["saved_file_name"],
-                ),
+            file_path = os.path.join(
+                data_output_path,
+                data_folder,
+                datasets_metadata["saved_file_name"],
+            )
+            latest_file_info.update(
+                _get_remote_file_infos(latest_file_info["download_url"])
             )
+
+            if os.path.exists(file_path) and _is_same_remote_file(
+                latest_file_info, datasets_metadata["latest_file_info"]
+            ):
+                logger.info(f"{file_path} content did not change, skipping download.")
+            else:
+                _dl_hdx_file(latest_file_info["download_url"], file_path)
             datasets_metadata["latest_file_info"] = latest_file_info
 
             return datasets_metadata
@@ -83,11 +160,58 @@ def _get_hdx_data(
         return None
 
 
-def _get_one_ressource_infos(one_ressource: BeautifulSoup) -> Dict[str, Any]:
+def _get_remote_file_infos(url: str) -> Dict[str, Any]:
+    """
+    Sends a HEAD request to the file URL and returns its size and ETag,
+    or an empty dictionary if the request fails.
+    """
+    try:
+        response = session.head(url, allow_redirects=True, timeout=requests_timeout)
+    except requests.RequestException as e:
+        logger.error(f"Failed to get the {url} file headers. {str(e)}")
+        return {}
+
+    if response.status_code != 200:
+        return {}
+
+    content_length = response.headers.get("Content-Length")
+    return {
+        "content_length": int(content_length) if content_length else None,
+        "etag": response.headers.get("ETag", ""),
+    }
+
+
+def _is_same_remote_file(
+    latest_file_info: Dict[str, Any], stored_file_info: Dict[str, Any]
+) -> bool:
+    """
+    Checks whether the remote file has the same size and ETag as the previously downloaded one.
+    """
+    content_length = latest_file_info.get("content_length")
+    return (
+        content_length is not None
+        and content_length == stored_file_info.get("content_length")
+        and latest_file_info.get("etag", "") == stored_file_info.get("etag", "")
+    )
+
+
+def _format_hdx_date(date_str: str) -> str:
+    """
+    Converts a date like '10 July 2024' to the format 'dd-mm-yyyy'.
+    Falls back to datetime parsing if the date does not have the expected format.
+    """
+    try:
+        day, month, year = date_str.split()
+        return f"{int(day):02d}-{months_numbers[month]}-{year}"
+    except (KeyError, ValueError):
+        return datetime.strptime(date_str, "%d %B %Y").strftime("%d-%m-%Y")
+
+
+def _get_one_ressource_infos(one_ressource: lxml.html.HtmlElement) -> Dict[str, Any]:
     """
 
     Inputs:
-    - one_ressource (BeautifulSoup element): A single resource item element from the HTML document.
+    - one_ressource (lxml.html.HtmlElement): A single resource item element from the HTML document.
 
     Outputs:
     - treated_doc (dict): A dictionary containing the information of the resource.
@@ -101,18 +225,11 @@ def _get_one_ressource_infos(one_ressource: BeautifulSoup) -> Dict[str, Any]:
     6. Return the dictionary 'treated_doc'.
     """
     treated_doc = {}
-    date_str = (
-        one_ressource.find("div", class_="update-date")
-        .text.strip()
-        .replace("Modified:", "")
-        .strip()
-    )
+    date_str = update_date_xpath(one_ressource).strip().replace("Modified:", "").strip()
 
-    treated_doc["file_time"] = datetime.strptime(date_str, "%d %B %Y").strftime(
-        "%d-%m-%Y"
-    )
+    treated_doc["file_time"] = _format_hdx_date(date_str)
 
-    download_url = one_ressource.find("a", class_="resource-url-analytics")["href"]
+    download_url = download_url_xpath(one_ressource)
 
     if download_url.startswith("/"):
         final_dl_url = f"https://data.humdata.org{download_url}"
@@ -123,10 +240,10 @@ def _get_one_ressource_infos(one_ressource: BeautifulSoup) -> Dict[str, Any]:
     return treated_doc
 
 
-def _get_hdx_file_infos(soup: BeautifulSoup, file_name: str):
+def _get_hdx_file_infos(tree: lxml.html.HtmlElement, file_name: str):
     """
     Inputs:
-    - soup (BeautifulSoup): Parsed HTML document containing the resources.
+    - tree (lxml.html.HtmlElement): Parsed HTML document containing the resources.
     - file_name (str): The name of the file to find within the resources. If set to "-", the first resource item is used.
 
     Outputs:
@@ -135,30 +252,31 @@ def _get_hdx_file_infos(soup: BeautifulSoup, file_name: str):
     Operation:
     1. Find all elements with the class 'resource-item' in the HTML document.
     2. If a specific file name is provided, iterate through the resource items to find the one with the matching title.
-    3. If a matching resource item is found, extract its information using the '_get_one_ressource_infos' function.
+    3. Once the first matching resource item is found, extract and return its information using
+       the '_get_one_ressource_infos' function. Raise a ValueError if no resource item matches.
     4. If no specific file name is provided, use the first resource item and extract its information.
     5. Return the extracted information as a dictionary.
     """
 
-    resource_items = soup.find_all("li", class_="resource-item")
+    resource_items = resource_items_xpath(tree)
 
     if file_name != "-":
         for one_ressource in resource_items:
-            doc_title = one_ressource.find("a", class_="heading")["title"]
+            doc_title = heading_title_xpath(one_ressource)
             if doc_title == file_name:
                 # treated_doc["title"] = doc_title
-                treated_doc = _get_one_ressource_infos(one_ressource)
+                return _get_one_ressource_infos(one_ressource)
 
-    else:
-        one_ressource = resource_items[0]
-        treated_doc = _get_one_ressource_infos(one_ressource)
+        raise ValueError(f"No resource with title {file_name!r}")
 
-    return treated_doc
+    one_ressource = resource_items[0]
+    return _get_one_ressource_infos(one_ressource)
 
 
 def _dl_hdx_file(url, file_path):
     """
     Downloads a file from the given URL and saves it to the specified path.
+    The file is streamed to disk in chunks, so it is never fully loaded in memory.
 
     Args:
         url (str): The URL of the file to be downloaded.
@@ -167,12 +285,15 @@ def _dl_hdx_file(url, file_path):
     Returns:
         None
     """
-    response = requests.get(url)
-
-    # Check if the request was successful
-    if response.status_code == 200:
-        with open(file_path, "wb") as file:
-            file.write(response.content)
-        # logger.info(f"File downloaded successfully and saved to {file_path}")
-    else:
-        logger.error(f"Failed to download file. Status code: {response.status_code}")
+    with session.get(url, stream=True, timeout=download_timeout) as response:
+        # Check if the request was successful
+        if response.status_code == 200:
+            # Transparently decode gzip / deflate content encodings
+            response.raw.decode_content = True
+            with open(file_path, "wb") as file:
+                shutil.copyfileobj(response.raw, file, length=download_chunk_size)
+            # logger.info(f"File downloaded successfully and saved to {file_path}")
+        else:
+            logger.error(
+                f"Failed to download file. Status code: {response.status_code}"
+            )
@@ -1,9 +1,13 @@
 import argparse
-import json
+import asyncio
 import logging
 import os
 import subprocess
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
 
 from data_sources_processing.acaps_inform_severity.acaps_inform_severity_data_preparation import \
     _get_acaps_inform_severity_data
@@ -40,6 +44,88 @@ datasets_processing_functions = {
 
 output_datasets_path = os.path.join("/data", "datasources")
 
+
+def _dataset_needs_update(dataset_metadata: Dict[str, Any]) -> bool:
+    """
+    Checks if the dataset needs to be updated based on its last update time and update frequency.
+    """
+    dataset_last_update = dataset_metadata["last_update_time"]
+    if dataset_last_update == "":
+        dataset_last_update = "01-01-2000"  # Set a default date very early on
+
+    dataset_update_frequency = dataset_metadata["update_frequency"]
+    # get the number of days difference between the last update and today
+    days_difference = (
+        today_date - datetime.strptime(dataset_last_update, time_format)
+    ).days
+    return days_difference >= dataset_update_frequency
+
+
+async def _update_one_dataset(
+    datasets_metadata: Dict[str, Any],
+    dataset_name: str,
+    sample_bool: bool,
+):
+    """
+    Runs the processing function of one dataset, then updates the datasets metadata in place with its result.
+    The processing functions are blocking and spend their time waiting on HTTP calls
+    (HDX, ACLED, OCHA HPC and OpenAI APIs), so each one is run in its own thread.
+    """
+    logger.info(f"---------------- Processing {dataset_name} ----------------")
+    new_latest_file_infos = await asyncio.to_thread(
+        datasets_processing_functions[dataset_name],
+        datasets_metadata[dataset_name],
+        output_datasets_path,
+    )
+    if new_latest_file_infos is not None:
+
+        datasets_metadata[dataset_name] = new_latest_file_infos
+        logger.info(f"{dataset_name} file updated successfully.")
+
+    if not sample_bool:
+        datasets_metadata[dataset_name]["last_update_time"] = today_date.strftime(
+            time_format
+        )
+
+
+async def _update_datasets(datasets_metadata: Dict[str, Any], sample_bool: bool):
+    """
+    Inputs:
+    - datasets_metadata (Dict[str, Any]): Metadata of all the datasets, updated in place.
+    - sample_bool (bool): Whether the run is a sample run, in which case the update time is not stored.
+
+    Operation:
+    1. Select the datasets that need to be updated.
+    2. Run their processing functions concurrently using '_update_one_dataset'.
+    3. Each dataset metadata is updated as soon as its processing function is done,
+       so that finished datasets are kept even if another one fails.
+    """
+    updated_datasets = []
+    for dataset_name in datasets_processing_functions:
+        if _dataset_needs_update(datasets_metadata[dataset_name]):
+            updated_datasets.append(dataset_name)
+        else:
+            logger.info(f"{dataset_name} file is already up to date.")
+
+    # asyncio.gather rather than TaskGroup, the runtime is Python 3.10
+    await asyncio.gather(
+        *(
+            _update_one_dataset(datasets_metadata, dataset_name, sample_bool)
+            for dataset_name in updated_datasets
+        ),
+        return_exceptions=False,
+    )
+
+
+def _save_datasets_metadata(datasets_metadata: Dict[str, Any]):
+    """
+    Atomically saves the datasets metadata, so the file is never left half-written.
+    """
+    tmp_datasets_metadata_path = f"{datasets_metadata_path}.tmp"
+    Path(tmp_datasets_metadata_path).write_bytes(orjson.dumps(datasets_metadata))
+    os.replace(tmp_datasets_metadata_path, datasets_metadata_path)
+
+
 if __name__ == "__main__":
 
     """
@@ -57,11 +143,11 @@ if __name__ == "__main__":
 
     Operation:
     1. Reads the datasets metadata from a JSON file.
-    2. Iterates through each dataset and its processing function.
-    3. Checks if the dataset needs to be updated based on its last update time and update frequency.
-    4. If an update is required, it processes the dataset using its corresponding function and updates the metadata.
-    5. Saves the updated metadata back to the JSON file.
-    6. Specifically checks if the 'ohchr' dataset is processed, and if not, runs two scripts to process it.
+    2. Selects the datasets that need to be updated based on their last update time and update frequency.
+    3. Processes these datasets concurrently using their corresponding functions and updates the metadata.
+    4. Saves the updated metadata back to the JSON file once, after all datasets are processed
+       or if one of them fails.
+    5. Specifically checks if the 'ohchr' dataset is processed, and if not, runs two scripts to process it.
     """
 
     args = argparse.ArgumentParser()
@@ -69,50 +155,13 @@ if __name__ == "__main__":
 
     sample_bool = args.parse_args().sample == "true"
 
-    with open(datasets_metadata_path, "r") as file:
-        datasets_metadata = json.load(file)
-
-    for (
-        dataset_name,
-        dataset_processing_function,
-    ) in datasets_processing_functions.items():
-
-        logger.info(f"---------------- Processing {dataset_name} ----------------")
+    datasets_metadata = orjson.loads(Path(datasets_metadata_path).read_bytes())
 
-        # Reload the datasets_metadata each time because functions may change it
-
-        dataset_last_update = datasets_metadata[dataset_name]["last_update_time"]
-        if dataset_last_update == "":
-            dataset_last_update = "01-01-2000"  # Set a default date very early on
-
-        dataset_update_frequency = datasets_metadata[dataset_name]["update_frequency"]
-        # get the number of days difference between the last update and today
-        days_difference = (
-            today_date - datetime.strptime(dataset_last_update, time_format)
-        ).days
-        if days_difference >= dataset_update_frequency:
-            # try:
-            new_latest_file_infos = dataset_processing_function(
-                datasets_metadata[dataset_name], output_datasets_path
-            )
-            if new_latest_file_infos is not None:
-
-                datasets_metadata[dataset_name] = new_latest_file_infos
-                logger.info(f"{dataset_name} file updated successfully.")
-
-            if not sample_bool:
-                datasets_metadata[dataset_name]["last_update_time"] = (
-                    today_date.strftime(time_format)
-                )
-
-            # save datasets metadata
-            with open(datasets_metadata_path, "w") as file:
-                json.dump(datasets_metadata, file)
-            # except Exception as e:
-            #     logger.error(f"Error processing {dataset_name}: {e}")
-
-        else:
-            logger.info(f"{dataset_name} file is already up to date.")
+    try:
+        asyncio.run(_update_datasets(datasets_metadata, sample_bool))
+    finally:
+        # save datasets metadata, even if one of the processing functions failed
+        _save_datasets_metadata(datasets_metadata)
 
     # process ohchr dataset if not there
     if not os.path.exists(os.path.join(output_datasets_path, "ohchr", "results")):
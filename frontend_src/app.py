@@ -1,7 +1,6 @@
-import json
 import os
 
-import pandas as pd
+import orjson
 import streamlit as st
 from frontend.src.authentification.auth import check_password
 from frontend.src.utils.utils_functions import (
@@ -29,26 +28,26 @@ from frontend.custom_pages.crisis_wise_analysis import _display_crisis_wise_anal
 from frontend.custom_pages.methodology import _show_methodological_details
 from frontend.custom_pages.worldwide_analysis import main_page
 from frontend.src.specific_datasets_scripts.acaps_inform_severity import (
+    _get_inform_severity_data_by_country,
     _load_information_severity_index_data,
 )
 from frontend.src.specific_datasets_scripts.acaps_protection_indicators import (
     _display_protection_data,
 )
 from frontend.src.specific_datasets_scripts.acled import _load_acled_data
-from frontend.src.specific_datasets_scripts.idmc import _load_idmc_data
-from frontend.src.specific_datasets_scripts.ipc import _load_preprocess_ipc_data
+from frontend.src.specific_datasets_scripts.idmc import _get_idmc_data_by_country
+from frontend.src.specific_datasets_scripts.ipc import _get_ipc_data_by_country
 from frontend.src.specific_datasets_scripts.ocha_hpc import (
     _get_country_wise_children_in_need_data,
     _get_country_wise_pin_data,
+    _get_country_wise_pin_data_by_country,
+    _get_pin_data_last_modified_time,
+    _load_pin_data,
 )
 from frontend.src.specific_datasets_scripts.ohchr import country_wise_legal_framework
 
 # from src.utils.pop_up import _show_pop_up
-from frontend.src.utils.load_geodata import _load_polygons_adm0
-from frontend.src.visualizations.maps_creation import (
-    default_filling_color,
-    severity_mapping_tag_name_to_color_main_countries,
-)
+from frontend.src.visualizations.maps_creation import _build_colored_polygons
 
 st.session_state["title_size"] = 30
 st.session_state["subtitle_size"] = 25
@@ -94,19 +93,41 @@ if check_password():
         "acaps_inform_severity",
         "INFORM Severity latest.xlsx",
     )
-    st.session_state["inform_severity_df"] = _load_information_severity_index_data()
+    (
+        st.session_state["inform_severity_df"],
+        st.session_state["inform_severity_last_updated"],
+    ) = _load_information_severity_index_data(
+        st.session_state["inform_severity_data_path"],
+        os.path.getmtime(st.session_state["inform_severity_data_path"]),
+    )
+    # Warm-up of the country profile INFORM Severity data of every country
+    st.session_state["inform_severity_data_by_country"] = (
+        _get_inform_severity_data_by_country(
+            tuple(st.session_state["countries"]),
+            os.path.getmtime(st.session_state["inform_severity_data_path"]),
+        )
+    )
 
     st.session_state["selected_tags"] = list(
         st.session_state["tag_name_to_indicators"].keys()
     ) + ["Legal Framework"]
 
     st.session_state["pin_df_path"] = os.path.join(
-        st.session_state["tabular_data_data_path"], "ocha_hpc", "OCHA PIN.csv"
+        st.session_state["tabular_data_data_path"], "ocha_hpc", "OCHA PIN.parquet"
+    )
+    st.session_state["all_pin_data"] = _load_pin_data(
+        st.session_state["pin_df_path"],
+        _get_pin_data_last_modified_time(st.session_state["pin_df_path"]),
     )
-    st.session_state["all_pin_data"] = pd.read_csv(st.session_state["pin_df_path"])
     st.session_state["country_wise_pin_data"] = _get_country_wise_pin_data(
         st.session_state["all_pin_data"]
     )
+    st.session_state["country_wise_pin_data_by_country"] = (
+        _get_country_wise_pin_data_by_country(
+            st.session_state["pin_df_path"],
+            _get_pin_data_last_modified_time(st.session_state["pin_df_path"]),
+        )
+    )
     st.session_state["ocha_hpc_min_year"] = st.session_state["all_pin_data"]["year"].min()
     st.session_state["ocha_hpc_max_year"] = st.session_state["all_pin_data"]["year"].max()
 
@@ -135,9 +156,11 @@ if check_password():
             "..",
             "acaps_protection_indicators_tags.json",
         ),
-        "r",
+        "rb",
     ) as f:
-        st.session_state["acaps_protection_indicators_child_related_tags"] = json.load(f)
+        st.session_state["acaps_protection_indicators_child_related_tags"] = (
+            orjson.loads(f.read())
+        )
 
     st.session_state["original_polygons_data_path"] = os.path.join(
         st.session_state["base_data_folder"], "polygons_data"
@@ -152,7 +175,10 @@ if check_password():
         st.session_state["tabular_data_data_path"], "unicef"
     )
 
-    st.session_state["ipc_df"] = _load_preprocess_ipc_data()
+    st.session_state["ipc_by_country"] = _get_ipc_data_by_country(
+        st.session_state["ipc_data_path"],
+        os.path.getmtime(st.session_state["ipc_data_path"]),
+    )
 
     st.session_state["idmc_data_path"] = os.path.join(
         st.session_state["tabular_data_data_path"],
@@ -160,7 +186,10 @@ if check_password():
         "IDMC_Internal_Displacement_Conflict-Violence_Disasters.xlsx",
     )
 
-    st.session_state["idmc_df"] = _load_idmc_data()
+    st.session_state["idmc_by_country"] = _get_idmc_data_by_country(
+        st.session_state["idmc_data_path"],
+        os.path.getmtime(st.session_state["idmc_data_path"]),
+    )
 
     st.session_state["legal_framework_summaries_data_path"] = os.path.join(
         st.session_state["base_data_folder"],
@@ -178,48 +207,14 @@ if check_password():
             "..",
             "grouped_legal_framework_indicators.json",
         ),
-        "r",
+        "rb",
     ) as f:
-        st.session_state["legal_framework_indicators"] = json.load(f)
-
-    if "geojson_country_polygons" not in st.session_state:
-        geojson_country_polygons = _load_polygons_adm0()
-
-        inform_severity_values = {
-            row["COUNTRY"]: {
-                "Situation Severity": row["INFORM Severity category name"],
-                "Drivers": row["DRIVERS"],
-                "Trend (last 3 months)": row["Trend (last 3 months)"],
-                "Last updated": row["Last updated"],
-            }
-            for i, row in st.session_state["inform_severity_df"].iterrows()
-        }
-
-        for feature in geojson_country_polygons["features"]:
-
-            country_name = feature["properties"]["name"]
-            if country_name in inform_severity_values:
-                one_country_values = inform_severity_values[country_name]
-                inform_index_properties = one_country_values["Situation Severity"]
-                if inform_index_properties != "x":
-                    feature["properties"]["fill_color"] = (
-                        severity_mapping_tag_name_to_color_main_countries[
-                            inform_index_properties
-                        ]
-                    )
-                else:
-                    feature["properties"]["fill_color"] = default_filling_color
-                legend = f" -- {country_name} --"
-                for key, value in one_country_values.items():
-                    final_value = value if value != "x" else "UNKNOWN"
-                    legend += f"\n{key}: {final_value}"
-
-            else:
-                feature["properties"]["fill_color"] = [255, 255, 255]
-                legend = f"Country: {country_name}"
-            feature["legend"] = legend
-
-        st.session_state["geojson_country_polygons"] = geojson_country_polygons
+        st.session_state["legal_framework_indicators"] = orjson.loads(f.read())
+
+    # Cached on the INFORM Severity data, so the map colours follow an updated file
+    st.session_state["geojson_country_polygons"] = _build_colored_polygons(
+        st.session_state["inform_severity_df"]
+    )
 
     main_font_css = """
     <style>
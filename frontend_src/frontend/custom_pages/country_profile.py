@@ -23,30 +23,38 @@ def _display_all_data(selected_country: str):
     """
     Displays a comprehensive analysis of various data related to child
     protection and humanitarian crises for a selected country.
+    Each section is its own fragment, so a widget change only reruns its own section.
 
     Args:
     - None
 
     Operation:
     1. Sets a custom title displaying the selected country's name with a large font size.
-    2. Defines columns for layout, allocating space for map data, additional summaries, and detailed analysis.
-    3. Calls `_display_map_data` to show a map of protection-related events filtered by type and date range.
-    4. Sets a custom title indicating the source of additional data related to child protection.
-    5. Calls `_display_main_summary` to display a summary of child protection indicators without showing evidence.
-    6. Calls `_display_pin_stackbar` to show a stacked bar chart related to Protection Indicators from ACAPS.
-    7. Calls `_display_crises_list` to display a list of crises impacting child protection.
-    8. Sets a custom title for displaying causes and underlying factors of child protection issues.
-    9. Calls `_show_physical_environment` to display data related to the physical environment affecting child protection.
-    10. Calls `_show_impact_of_the_crisis` to display data related to the impact of crises on child protection.
-    11. Calls `_display_number_of_events_targetting_civilians` to display the number of events targeting civilians.
-    12. Calls `_show_barriers_goods_services` to display data related to barriers in accessing goods and services.
-    13. Calls `_plot_ipc_results` to display results related to food insecurity using IPC results.
-    14. Calls `_get_displacement_numbers` to display data related to displacement numbers.
-    15. Calls `country_wise_legal_framework` to display an overview of the legal framework related to child protection.
-    16. Calls `_display_child_protection_risks` to display risks related to child protection.
-    17. Calls `_display_specific_protection_indicators` to display specific protection indicators.
-    18. Calls `_display_tabular_mortality_rates` to display tabular data related to mortality rates.
+    2. Gets the INFORM Severity data of the selected country, loaded for all the countries at startup,
+       and passes it to the INFORM Severity fragments.
+    3. Defines columns for layout, allocating space for map data, additional summaries, and detailed analysis.
+    4. Calls `_display_map_data` to show a map of protection-related events filtered by type and date range.
+    5. Sets a custom title indicating the source of additional data related to child protection.
+    6. Calls `_display_main_summary` to display a summary of child protection indicators without showing evidence.
+    7. Calls `_display_pin_stackbar` to show a stacked bar chart related to Protection Indicators from ACAPS.
+    8. Calls `_display_crises_list` to display a list of crises impacting child protection.
+    9. Sets a custom title for displaying causes and underlying factors of child protection issues.
+    10. Calls `_show_physical_environment` to display data related to the physical environment affecting child protection.
+    11. Calls `_show_impact_of_the_crisis` to display data related to the impact of crises on child protection.
+    12. Calls `_display_number_of_events_targetting_civilians` to display the number of events targeting civilians.
+    13. Calls `_show_barriers_goods_services` to display data related to barriers in accessing goods and services.
+    14. Calls `_plot_ipc_results` to display results related to food insecurity using IPC results.
+    15. Calls `_get_displacement_numbers` to display data related to displacement numbers.
+    16. Calls `country_wise_legal_framework` to display an overview of the legal framework related to child protection.
+    17. Calls `_display_child_protection_risks` to display risks related to child protection.
+    18. Calls `_display_specific_protection_indicators` to display specific protection indicators.
+    19. Calls `_display_tabular_mortality_rates` to display tabular data related to mortality rates.
     """
+    # INFORM Severity data shared by its fragments, loaded for all the countries at startup
+    country_inform_severity_data = st.session_state["inform_severity_data_by_country"][
+        selected_country
+    ]
+
     map_col, _, additional_col = st.columns([0.47, 0.06, 0.47])  # , 0.05, 0.2]
     with map_col:
         _display_acled_map_data(selected_country)
@@ -61,7 +69,7 @@ def _display_all_data(selected_country: str):
         _display_main_summary(selected_country, display_evidence=False)
 
         _display_pin_stackbar(selected_country)
-        _display_crises_list(selected_country)
+        _display_crises_list(selected_country, country_inform_severity_data)
 
     _custom_title(
         "Causes & Underlying Factors", font_size=st.session_state["title_size"]
@@ -69,10 +77,10 @@ def _display_all_data(selected_country: str):
     st.write(" ")
     physical_env_col, _, impact_of_the_crisis_col = st.columns([0.47, 0.06, 0.47])
     with physical_env_col:
-        _show_physical_environment(selected_country)
+        _show_physical_environment(selected_country, country_inform_severity_data)
 
     with impact_of_the_crisis_col:
-        _show_impact_of_the_crisis(selected_country)
+        _show_impact_of_the_crisis(selected_country, country_inform_severity_data)
 
     _add_blank_space(1)
 
@@ -80,7 +88,7 @@ def _display_all_data(selected_country: str):
 
     barriers_col, _, food_insecurity_col = st.columns([0.47, 0.06, 0.47])
     with barriers_col:
-        _show_barriers_goods_services(selected_country)
+        _show_barriers_goods_services(selected_country, country_inform_severity_data)
 
     with food_insecurity_col:
         _plot_ipc_results(selected_country)
@@ -1,23 +1,39 @@
-import streamlit as st
-from frontend.src.utils.utils_functions import _custom_title
+import textwrap
 
+import streamlit as st
+from frontend.src.utils.utils_functions import (_get_source_html,
+                                                _get_title_html,
+                                                title_separator)
 
-def _show_methodological_details():
 
+def _get_section_title(title: str, font_size: int = 24) -> str:
+    """
+    Builds the same markup as `_custom_title` for a section title without source,
+    so that the whole page can be rendered in a single markdown call.
+    """
+    title_blocks = [_get_title_html(title, font_size), _get_source_html("", 0)]
+    if font_size == 30:
+        title_blocks = [
+            title_separator,
+            title_blocks[0],
+            title_separator,
+            title_blocks[1],
+        ]
+    return "\n\n".join(textwrap.dedent(block).strip() for block in title_blocks)
+
+
+# The page content is static: it is built once, at import time
+methodology_blocks = [
     # Add the main content
-    st.markdown(
-        """
+    """
     This product showcases a comprehensive collection of data sources and indicators pertinent to child protection (using the Needs Identification Analysis Framework (NIAF) as a basis),
     streamlined through a central online platform. Utilizing open-source technologies, the application enhances the
     coordination and management of humanitarian data, facilitating rapid access to vital information and analytics
     for child protection efforts globally.
-    """
-    )
-
+    """,
     # Section: Technology and Tools
-    _custom_title("Technology and Tools", 24)
-    st.markdown(
-        """
+    _get_section_title("Technology and Tools"),
+    """
     **Python:** The backbone of our data processing, Python provides the flexibility and robust capabilities required
     for advanced data manipulation and analysis. Its extensive libraries support a variety of functionalities from
     data scraping to deep learning, making it ideal for backend development.
@@ -25,13 +41,10 @@ def _show_methodological_details():
     **Streamlit:** This open-source framework allows for the quick creation of interactive and user-friendly web applications.
     Streamlit interfaces seamlessly with Python, enabling real-time data updates and interactive visualization, which are crucial
     for dynamic data displays and user engagement.
-    """
-    )
-
+    """,
     # Section: Application Features
-    _custom_title("Application Features", 24)
-    st.markdown(
-        """
+    _get_section_title("Application Features"),
+    """
     **Interactive Dashboards:** Users can interact with a variety of data visualizations, including risk maps, country profiles,
     and child protection summaries. These dashboards dynamically adapt to new data, providing up-to-date insights.
 
@@ -47,23 +60,17 @@ def _show_methodological_details():
 
     **Customizable Indicators and Filters:** Users can select specific indicators and filters to view customized data sets that meet
     their unique requirements, enhancing the app’s utility.
-    """
-    )
-
+    """,
     # Section: Security and Accessibility
-    _custom_title("Security and Accessibility", 24)
-    st.markdown(
-        """
+    _get_section_title("Security and Accessibility"),
+    """
     The application is designed with a focus on security, ensuring that sensitive data is protected through access control measures.
     It is accessible across multiple devices, providing a consistent user experience that facilitates global access by child protection
     coordinators and other stakeholders.
-    """
-    )
-
+    """,
     # Section: Data Sources
-    _custom_title("Update Frequency of Data Sources", 24)
-    st.markdown(
-        """
+    _get_section_title("Update Frequency of Data Sources"),
+    """
     This product is updated every 10 days, and scripts are run to update each data source at different intervals, depending on the source's data update schedule. Please refer to the specific methodology of each data source to understand their individual update frequencies:
 
     The data displayed in this application is sourced from various respected organizations, including ACLED, ACAPS, UNICEF, IPC, OHCHR, and IDMC.
@@ -80,56 +87,41 @@ def _show_methodological_details():
 
     Global Child Protection Area of Responsibility (GCP AoR) does not bear responsibility for the data provided. Users are encouraged to refer to
     the specific methodologies of each data source to understand the methods and appropriate use of the indicators provided.
-    """
-    )
-
+    """,
     # Section: Disclaimer and Terms of Use
-    _custom_title("Disclaimer and Terms of Use", font_size=30)
-    st.markdown(
-        """
+    _get_section_title("Disclaimer and Terms of Use", font_size=30),
+    """
     The information provided on this platform is for informational purposes only.
     The Global Child Protection Area of Responsibility (GCP AoR) makes no representations or warranties,
     expressed or implied, regarding the accuracy, completeness, or suitability for any particular purpose
     of the information available. The GCP AoR is not liable for any loss, damage, or liability
     arising from the use of this platform, and all use is at the user’s own risk.
-    """
-    )
-
+    """,
     # Section: Content and Updates
-    _custom_title("Content and Updates", 24)
-    st.markdown(
-        """
+    _get_section_title("Content and Updates"),
+    """
     The GCP AoR may update or modify content on this platform without notice. Users are advised not to rely solely
     on the information provided here for critical decisions.
-    """
-    )
-
+    """,
     # Section: Third-Party Links and Information
-    _custom_title("Third-Party Links and Information", 24)
-    st.markdown(
-        """
+    _get_section_title("Third-Party Links and Information"),
+    """
     This platform may include links to third-party websites and may contain advice, opinions,
     and statements from external providers. Reliance upon any such advice, opinion, statement,
     or other information shall also be at the User’s own risk. The GCP AoR does not control and
     is not responsible for the content or accuracy of these external sites. Links to third-party
     sites do not imply endorsement by the GCP AoR.
-    """
-    )
-
+    """,
     # Section: Geographical and Political Information
-    _custom_title("Geographical and Political Information", 24)
-    st.markdown(
-        """
+    _get_section_title("Geographical and Political Information"),
+    """
     The presentation of geographical or political information does not imply endorsement by the GCP AoR.
     Terms like "country" refer generally to regions as appropriate, without assumptions regarding
     legal status or boundaries.
-    """
-    )
-
+    """,
     # Section: NLP and AI-Generated Content
-    _custom_title("NLP and AI-Generated Content", 24)
-    st.markdown(
-        """
+    _get_section_title("NLP and AI-Generated Content"),
+    """
     Content generated by Natural Language Processing (NLP) and AI (Artificial Intelligence)
     technologies is incorporated to enhance accessibility and understanding. However, this AI-generated
     content may contain inaccuracies or omissions and is not guaranteed for accuracy. Users should exercise
@@ -138,13 +130,18 @@ def _show_methodological_details():
     to modify or remove such content at any time.
 
     By using this platform, you acknowledge and agree to these terms.
-    """
-    )
-
+    """,
     # Section: Contact
-    _custom_title("Contact", 24)
-    st.markdown(
-        """
-    [Contact the GCP AoR IM Team](mailto:SWZ-gcpaor-data-unit@unicef.org) for any additional question.
+    _get_section_title("Contact"),
     """
-    )
+    [Contact the GCP AoR IM Team](mailto:SWZ-gcpaor-data-unit@unicef.org) for any additional question.
+    """,
+]
+
+methodology_markdown = "\n\n".join(
+    textwrap.dedent(block).strip() for block in methodology_blocks
+)
+
+
+def _show_methodological_details():
+    st.markdown(methodology_markdown, unsafe_allow_html=True)
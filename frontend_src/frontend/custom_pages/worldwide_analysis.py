@@ -9,6 +9,21 @@ from frontend.src.visualizations.barchart import _get_abbreviated_number
 from frontend.src.visualizations.maps_creation import \
     _create_polygons_map_placeholder_pdk
 
+# Static markup of the key indicator boxes, only the colors and texts change
+indicator_box_template = """
+<div style="
+    background-color: {background_color};
+    border-radius: 10px;
+    padding: 10px;
+    text-align: center;
+    box-shadow: 0 2px 4px 0 rgba(0,0,0,0.2);
+    margin-bottom: {margin_bottom};
+    transition: 0.3s;">
+    <h2 style="color: #333333; font-size: 30px; margin: 0;">{value}</h2>
+    <p style="color: #333333; font-size: 16px; margin: 0;">{caption}</p>
+</div>
+"""
+
 
 @st.fragment
 def main_page():
@@ -23,7 +38,8 @@ def main_page():
     - Total Child Protection (CP) caseload in need across countries.
     - Ratio of children in need to total population in need.
     - Ratio of targeted CP interventions to children in need.
-    4. Uses custom CSS styles to format and display the key indicators in colored boxes.
+    4. Uses custom CSS styles to format and display the key indicators in colored boxes,
+       rendered with a single markdown call.
     5. Displays top countries by proportion of children in need and their
       evolution using data from OCHA HPC Plans Summary API.
     """
@@ -61,68 +77,59 @@ def main_page():
                 source="OCHA HPC Plans Summary API",
                 date=st.session_state["ocha_hpc_max_year"],
             )
-            # Define the custom style for the first box
+            country_wise_pin_data = st.session_state["country_wise_pin_data"]
             total_number_of_children_in_need, n_countries_number_of_children_in_need = (
-                _get_total_CP_caseload_in_need()
+                _get_total_CP_caseload_in_need(country_wise_pin_data)
             )
             shown_total_number_of_children_in_need = _get_abbreviated_number(
-                int(total_number_of_children_in_need.replace(",", ""))
+                total_number_of_children_in_need
             ).replace(" ", "\n")
-            first_indicator_custom_css = f"""
-            <div style="
-                background-color: #C6BFD0;
-                border-radius: 10px;
-                padding: 10px;
-                text-align: center;
-                box-shadow: 0 2px 4px 0 rgba(0,0,0,0.2);
-                margin-bottom: 20px;
-                transition: 0.3s;">
-                <h2 style="color: #333333; font-size: 30px; margin: 0;">{shown_total_number_of_children_in_need}</h2>
-                <p style="color: #333333; font-size: 16px; margin: 0;">CP Caseload in Need ({n_countries_number_of_children_in_need} Countries)</p>
-            </div>
-            """
 
-            # Define the custom style for the second box
             (
                 ratio_children_in_need_to_ppl_in_need,
                 n_countries_ratio_children_in_need_to_ppl_in_need,
-            ) = _get_ratio_children_in_need_to_pop_in_need()
-            second_indicator_custom_css = f"""
-            <div style="
-                background-color: #90AF95;
-                border-radius: 10px;
-                padding: 10px;
-                text-align: center;
-                box-shadow: 0 2px 4px 0 rgba(0,0,0,0.2);
-                margin-bottom: 20px;
-                transition: 0.3s;">
-                <h2 style="color: #333333; font-size: 30px; margin: 0;">{ratio_children_in_need_to_ppl_in_need}</h2>
-                <p style="color: #333333; font-size: 16px; margin: 0;">% CP caseload (in need) vs Total PiN (country level) ({n_countries_ratio_children_in_need_to_ppl_in_need} Countries)</p>
-            </div>
-            """
+            ) = _get_ratio_children_in_need_to_pop_in_need(country_wise_pin_data)
 
-            # Define the custom style for the third box
             (
                 ratio_children_targeted_to_children_in_need,
                 n_countries_ratio_children_targeted_to_children_in_need,
-            ) = _get_ratio_children_targeted_to_children_in_need()
-            third_indicator_custom_css = f"""
-            <div style="
-                background-color: #9FD5B5;
-                border-radius: 10px;
-                padding: 10px;
-                text-align: center;
-                box-shadow: 0 2px 4px 0 rgba(0,0,0,0.2);
-                transition: 0.3s;">
-                <h2 style="color: #333333; font-size: 30px; margin: 0;">{ratio_children_targeted_to_children_in_need}</h2>
-                <p style="color: #333333; font-size: 16px; margin: 0;">% CP targeted vs in need ({n_countries_ratio_children_targeted_to_children_in_need} Countries)</p>  # noqa
-            </div>
-            """
+            ) = _get_ratio_children_targeted_to_children_in_need(country_wise_pin_data)
+
+            # (background color, bottom margin, value, caption) of each box
+            indicator_boxes = [
+                (
+                    "#C6BFD0",
+                    "20px",
+                    shown_total_number_of_children_in_need,
+                    f"CP Caseload in Need ({n_countries_number_of_children_in_need} Countries)",
+                ),
+                (
+                    "#90AF95",
+                    "20px",
+                    ratio_children_in_need_to_ppl_in_need,
+                    f"% CP caseload (in need) vs Total PiN (country level) ({n_countries_ratio_children_in_need_to_ppl_in_need} Countries)",  # noqa
+                ),
+                (
+                    "#9FD5B5",
+                    "0px",
+                    ratio_children_targeted_to_children_in_need,
+                    f"% CP targeted vs in need ({n_countries_ratio_children_targeted_to_children_in_need} Countries)",  # noqa
+                ),
+            ]
 
-            # Use markdown to display the custom-styled boxes
-            st.markdown(first_indicator_custom_css, unsafe_allow_html=True)
-            st.markdown(second_indicator_custom_css, unsafe_allow_html=True)
-            st.markdown(third_indicator_custom_css, unsafe_allow_html=True)
+            # Use a single markdown call to display the custom-styled boxes
+            st.markdown(
+                "".join(
+                    indicator_box_template.format(
+                        background_color=background_color,
+                        margin_bottom=margin_bottom,
+                        value=value,
+                        caption=caption,
+                    )
+                    for background_color, margin_bottom, value, caption in indicator_boxes
+                ),
+                unsafe_allow_html=True,
+            )
 
     for _ in range(2):
         st.markdown("")
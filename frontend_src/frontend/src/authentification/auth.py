@@ -1,3 +1,4 @@
+import hmac
 import os
 
 import streamlit as st
@@ -7,17 +8,31 @@ load_dotenv()
 
 STREAMLIT_USER_PASSWORD = os.environ.get("STREAMLIT_USER_PASSWORD", None)
 
+# Accepted passwords, read once from the secrets and the environment
+PASSWORD_CANDIDATES = tuple(
+    password.encode()
+    for password in (st.secrets.get("password_user"), STREAMLIT_USER_PASSWORD)
+    if password
+)
+
 
 def check_password():
-    """Returns True if the user had the correct password."""
+    """
+    Returns True if the user had the correct password.
+    Otherwise, shows the password input and stops the script run,
+    so no page content is computed before the user is authenticated.
+    """
 
     def password_entered():
         """Checks whether a password entered by the user is correct."""
         if (
             "password" in st.session_state
             and st.session_state["password"]
-            and st.session_state["password"]
-            in [st.secrets["password_user"], STREAMLIT_USER_PASSWORD]
+            # constant-time comparison, to avoid timing attacks
+            and any(
+                hmac.compare_digest(st.session_state["password"].encode(), candidate)
+                for candidate in PASSWORD_CANDIDATES
+            )
         ):
             st.session_state["password_correct"] = True
             del st.session_state["password"]  # don't store password
@@ -25,19 +40,15 @@ def check_password():
         else:
             st.session_state["password_correct"] = False
 
-    if "password_correct" not in st.session_state:
-        # First run, show input for password.
-        st.text_input(
-            "Password", type="password", on_change=password_entered, key="password"
-        )
-        return False
-    elif not st.session_state["password_correct"]:
-        # Password not correct, show input + error.
-        st.text_input(
-            "Password", type="password", on_change=password_entered, key="password"
-        )
-        st.error("😕 Password incorrect")
-        return False
-    else:
+    if st.session_state.get("password_correct", False):
         # Password correct.
         return True
+
+    # First run or password not correct, show input for password.
+    st.text_input(
+        "Password", type="password", on_change=password_entered, key="password"
+    )
+    if "password_correct" in st.session_state:
+        # Password not correct, show error.
+        st.error("😕 Password incorrect")
+    st.stop()
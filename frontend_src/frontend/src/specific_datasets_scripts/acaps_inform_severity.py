@@ -1,3 +1,6 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
 import pandas as pd
 import streamlit as st
 from frontend.src.utils.utils_functions import (
@@ -8,6 +11,81 @@ from frontend.src.visualizations.barchart import \
 
 country_names_mapping = {"DRC": "Congo DRC", "CAR": "Central African Republic"}
 
+# Text columns identifying the crises in the crisis specific sheets, the other columns are scores
+crisis_identification_columns = ["CRISIS", "DRIVERS", "CRISIS ID", "COUNTRY", "Iso3"]
+
+# Impact of the crisis columns and their displayed labels
+columns_to_shown_val = {
+    "% of total area affected": "% of total area affected",
+    "% of total population living in the affected area": "% of total population living\nin the affected area",
+    "% of total population displaced on the total population affected": "% of total population displaced\non the total population affected",  # noqa
+    "% of fatalities on the total population affected": "% of fatalities on\nthe total population affected",
+}
+
+# Barriers to accessing goods and services columns and their displayed labels
+columns_to_show_name = {
+    "Ongoing insecurity/hostilities affecting humanitarian assistance": "Ongoing insecurity hostilities\naffecting humanitarian assistance",  # noqa
+    "Physical constraints in the environment (obstacles related to terrain, climate, lack of infrastructure, etc.)": "Physical constraints in the environment\n(obstacles related to terrain, climate,\nlack of infrastructure, etc.)",  # noqa
+    "Violence against personnel, facilities and assets": "Violence against personnel,\nfacilities and assets",
+    "Denial of existence of humanitarian needs or entitlements to assistance": "Denial of existence of humanitarian\nneeds or entitlements to assistance",  # noqa
+    "Presence of mines and improvised explosive devices": "Presence of mines and\nimprovised explosive devices",
+}
+
+# The shared workbook is not safe to parse from several sessions at the same time
+inform_severity_workbook_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_inform_severity_workbook(
+    data_path: str, last_modified_time: float
+) -> pd.ExcelFile:
+    """
+    Opens the INFORM Severity workbook once, with the calamine reader which does not build
+    openpyxl cell objects. The file modification time is part of the cache key,
+    so an updated file is opened again.
+    """
+    return pd.ExcelFile(data_path, engine="calamine")
+
+
+@st.cache_data(show_spinner=False)
+def _read_inform_severity_sheet(
+    data_path: str,
+    last_modified_time: float,
+    sheet_name: str,
+    header: int,
+    n_skipped_rows: int,
+) -> pd.DataFrame:
+    """
+    Parses one sheet of the INFORM Severity workbook, once per sheet and file version.
+    The 'n_skipped_rows' rows following the header are skipped by the parser,
+    so the data columns get their numeric dtypes directly.
+    """
+    workbook = _get_inform_severity_workbook(data_path, last_modified_time)
+    with inform_severity_workbook_lock:
+        return workbook.parse(
+            sheet_name=sheet_name,
+            header=header,
+            skiprows=range(header + 1, header + 1 + n_skipped_rows),
+        )
+
+
+def _load_inform_severity_sheet(
+    last_modified_time: float, sheet_name: str, header: int, n_skipped_rows: int = 0
+) -> pd.DataFrame:
+    """
+    Function to load one sheet of the INFORM Severity workbook, shared by all the loaders.
+    The file modification time is passed by the cached callers, so the parsed sheet
+    matches the file version of their cache key.
+    """
+    return _read_inform_severity_sheet(
+        st.session_state["inform_severity_data_path"],
+        last_modified_time,
+        sheet_name,
+        header,
+        n_skipped_rows,
+    )
+
+
 def _clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     Cleans the columns of a DataFrame by stripping whitespace from column names.
@@ -20,40 +98,45 @@ def _clean_columns(df: pd.DataFrame) -> pd.DataFrame:
     """
     df = df.rename(columns={col: col.strip() for col in df.columns})
     if "COUNTRY" in df.columns:
-        df["COUNTRY"] = df["COUNTRY"].apply(lambda x: country_names_mapping.get(x, x))
+        df["COUNTRY"] = df["COUNTRY"].replace(country_names_mapping)
     return df
 
 
-def _load_information_severity_index_data():
+@st.cache_data(show_spinner=False)
+def _load_information_severity_index_data(
+    data_path: str, last_modified_time: float
+) -> Tuple[pd.DataFrame, str]:
     """
-    Function to load the INFORM Severity Index data.
+    Function to load the INFORM Severity Index data, and its last update date (month-year)
+    computed from the parsed dates before they are formatted.
     """
 
-    df_countries = pd.read_excel(
-        st.session_state["inform_severity_data_path"],
-        sheet_name="INFORM Severity - country",
+    df_countries = _read_inform_severity_sheet(
+        data_path,
+        last_modified_time,
+        "INFORM Severity - country",
         header=1,
-    ).iloc[2:]
+        n_skipped_rows=2,
+    )
 
     df_countries = _clean_columns(df_countries)
 
-    df_countries["Last updated"] = pd.to_datetime(
-        df_countries["Last updated"]
-    ).dt.strftime("%d-%m-%Y")
-
     df_countries = df_countries[
         df_countries.COUNTRY.isin(st.session_state["countries"])
     ].rename(columns={"INFORM Severity category.1": "INFORM Severity category name"})
 
-    st.session_state["inform_severity_last_updated"] = "-".join(
-        df_countries["Last updated"].max().split("-")[1:]
-    )  # .strftime("%m-%Y")
+    last_updated_dates = pd.to_datetime(df_countries["Last updated"])
+    df_countries["Last updated"] = last_updated_dates.dt.strftime("%d-%m-%Y")
 
-    return df_countries
+    return df_countries, last_updated_dates.max().strftime("%m-%Y")
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def _load_crisis_specific_df_many_empty_rows(
-    selected_country: str, sheet_name: str, initial_row_number: int
+    selected_country: str,
+    sheet_name: str,
+    initial_row_number: int,
+    last_modified_time: float,
 ):
     """
     Loads a specific crisis-related DataFrame with potentially many empty rows from an Excel sheet.
@@ -61,47 +144,52 @@ def _load_crisis_specific_df_many_empty_rows(
     Parameters:
     sheet_name (str): The name of the sheet in the Excel file.
     initial_row_number (int): The initial row number from which to start loading data.
+    last_modified_time (float): Modification time of the Excel file.
 
     Returns:
     pd.DataFrame: The loaded DataFrame containing crisis-related data filtered for the selected country.
 
     Operation:
     1. Defines a mapping for translating country names.
-    2. Reads an Excel file into a DataFrame, starting from a specified row, and renames columns.
+    2. Parses the sheet from the shared INFORM Severity workbook handle, starting from a specified row, and renames columns.
     3. Filters the DataFrame to include only rows matching the selected country stored in Streamlit session state.
-    4. Returns the filtered DataFrame containing crisis-related data.
+    4. Replaces the 'x' values of the text score columns by -1 and converts them to numeric dtypes.
+    5. Returns the filtered DataFrame containing crisis-related data.
     """
-    crisis_wide_df = (
-        pd.read_excel(
-            st.session_state["inform_severity_data_path"],
-            sheet_name=sheet_name,
-            header=1,
-        )
-        .rename(
-            columns={
-                "Unnamed: 0": "CRISIS",
-                "Unnamed: 1": "DRIVERS",
-                "Unnamed: 2": "CRISIS ID",
-                "Unnamed: 3": "COUNTRY",
-                "Unnamed: 4": "Iso3",
-            }
-        )
-        .iloc[initial_row_number:]
+    crisis_wide_df = _load_inform_severity_sheet(
+        last_modified_time, sheet_name, header=1, n_skipped_rows=initial_row_number
+    ).rename(
+        columns={
+            "Unnamed: 0": "CRISIS",
+            "Unnamed: 1": "DRIVERS",
+            "Unnamed: 2": "CRISIS ID",
+            "Unnamed: 3": "COUNTRY",
+            "Unnamed: 4": "Iso3",
+        }
     )
-    crisis_wide_df["COUNTRY"] = crisis_wide_df["COUNTRY"].apply(
-        lambda x: country_names_mapping.get(x, x)
+    crisis_wide_df["COUNTRY"] = crisis_wide_df["COUNTRY"].replace(country_names_mapping)
+    crisis_wide_df = crisis_wide_df[crisis_wide_df["COUNTRY"] == selected_country]
+
+    # Only the text score columns can hold 'x' values, once they are replaced
+    # these columns can be stored as numeric columns
+    score_columns = crisis_wide_df.select_dtypes(exclude="number").columns.difference(
+        crisis_identification_columns, sort=False
     )
-    crisis_wide_df = crisis_wide_df[
-        crisis_wide_df["COUNTRY"] == selected_country
-    ].replace("x", -1)
+    crisis_wide_df = crisis_wide_df.replace(
+        {col: {"x": -1} for col in score_columns}
+    ).infer_objects()
 
     crisis_wide_df = _clean_columns(crisis_wide_df)
 
     return crisis_wide_df
 
 
+@st.cache_data(show_spinner=False, ttl=3600)
 def _load_crisis_specific_df_few_empty_rows(
-    selected_country: str, sheet_name: str, initial_row_number: int
+    selected_country: str,
+    sheet_name: str,
+    initial_row_number: int,
+    last_modified_time: float,
 ):
     """
     Loads a specific crisis-related DataFrame with few empty rows from an Excel sheet.
@@ -109,20 +197,17 @@ def _load_crisis_specific_df_few_empty_rows(
     Parameters:
     sheet_name (str): The name of the sheet in the Excel file.
     initial_row_number (int): The initial row number from which to start loading data.
+    last_modified_time (float): Modification time of the Excel file.
 
     Returns:
     pd.DataFrame: The loaded DataFrame containing crisis-related data.
 
     Operation:
-    1. Reads an Excel file into a DataFrame, starting from a specified row, and renames columns.
+    1. Parses the sheet from the shared INFORM Severity workbook handle, starting from a specified row, and renames columns.
     2. Returns the loaded DataFrame containing crisis-related data.
     """
-    crisis_wide_df = (
-        pd.read_excel(
-            st.session_state["inform_severity_data_path"],
-            sheet_name=sheet_name,
-            header=0,
-        ).iloc[initial_row_number:]
+    crisis_wide_df = _load_inform_severity_sheet(
+        last_modified_time, sheet_name, header=0, n_skipped_rows=initial_row_number
     ).rename(columns={"Crisis": "CRISIS"})
 
     crisis_wide_df = _clean_columns(crisis_wide_df)
@@ -131,44 +216,39 @@ def _load_crisis_specific_df_few_empty_rows(
     return crisis_wide_df
 
 
-def _get_list_of_crises(selected_country: str):
+@st.cache_data(show_spinner=False, ttl=3600)
+def _get_list_of_crises(selected_country: str, last_modified_time: float):
     """
     Function to get a list of crises from the INFORM Severity Index data.
     """
+    # The loaded rows are already those of the selected country
     treated_crises = _load_crisis_specific_df_many_empty_rows(
-        selected_country, "Impact of the crisis", 3
+        selected_country, "Impact of the crisis", 3, last_modified_time
     )
-    treated_crises = treated_crises[treated_crises["COUNTRY"] == selected_country]
     # st.dataframe(treated_crises)
     treated_crises = treated_crises["CRISIS"].unique()
     return treated_crises
 
 
-@st.fragment
-def _show_physical_environment(selected_country: str):
+def _compute_physical_environment_maxes(
+    selected_country: str, last_modified_time: float
+) -> Optional[pd.DataFrame]:
     """
-    Displays the physical environment indicators related to crises using horizontal continuous scale bar plots.
+    Computes the maximum values of the physical environment indicators over the crises of the selected country.
+
+    Returns:
+    Optional[pd.DataFrame]: The 'Indicator' and 'Value' columns, or None if no data is available for the selected country.
 
     Operation:
-    1. Sets a custom title for the section.
-    2. Loads specific crisis-related data from Excel sheets for different indicators.
-    3. If no data is available for the selected country, displays a message and returns.
-    4. Calculates maximum values for main indicators and complexity of the crisis indicators.
-    5. Combines and prepares the data into a final DataFrame.
-    6. Creates a horizontal continuous scale bar plot to visualize the indicators.
+    1. Loads specific crisis-related data from Excel sheets for different indicators.
+    2. Calculates maximum values for main indicators and complexity of the crisis indicators.
+    3. Builds the final DataFrame directly from the maximum values.
     """
-    _custom_title(
-        "Physical environment",
-        font_size=st.session_state["subtitle_size"],
-        source="ACAPS, INFORM Severity Index",
-        date=st.session_state["inform_severity_last_updated"],
-    )
     df_main_sheet = _load_crisis_specific_df_many_empty_rows(
-        selected_country, "INFORM Severity - all crises", 2
+        selected_country, "INFORM Severity - all crises", 2, last_modified_time
     )
     if len(df_main_sheet) == 0:
-        st.markdown(f"No information available for {selected_country}")
-        return
+        return None
 
     # st.dataframe(df_main_sheet)
 
@@ -178,24 +258,52 @@ def _show_physical_environment(selected_country: str):
         "Complexity of the crisis",
     ]
 
-    results_main_sheet = df_main_sheet[main_sheet_indicators].max(axis=0).to_frame().T
+    main_sheet_values = df_main_sheet[main_sheet_indicators].max(axis=0).tolist()
 
     complexity_of_the_crisis_indicators = ["Safety and security", "Humanitarian access"]
-    complexity_of_the_crisis_df = (
+    complexity_of_the_crisis_values = (
         _load_crisis_specific_df_many_empty_rows(
-            selected_country, "Complexity of the crisis", 3
+            selected_country, "Complexity of the crisis", 3, last_modified_time
         )[complexity_of_the_crisis_indicators]
         .max(axis=0)
-        .to_frame()
-        .T
+        .tolist()
     )
 
-    final_df = pd.concat(
-        [results_main_sheet, complexity_of_the_crisis_df], axis=1
-    ).T.rename(columns={0: "Value"})
-    final_df["Indicator"] = final_df.index
+    final_df = pd.DataFrame(
+        {
+            "Value": pd.Series(
+                main_sheet_values + complexity_of_the_crisis_values, dtype=float
+            ),
+            "Indicator": main_sheet_indicators + complexity_of_the_crisis_indicators,
+        }
+    )
     # final_df["Indicator"] = final_df["Indicator"].apply(lambda x: mapping_index_to_shown_val.get(x, x))
-    final_df.reset_index(drop=True, inplace=True)
+    return final_df
+
+
+@st.fragment
+def _show_physical_environment(
+    selected_country: str, country_inform_severity_data: Dict[str, Any]
+):
+    """
+    Displays the physical environment indicators related to crises using horizontal continuous scale bar plots.
+
+    Operation:
+    1. Sets a custom title for the section.
+    2. Gets the indicators maximum values from the data loaded by `_load_country_inform_severity_data`.
+    3. If no data is available for the selected country, displays a message and returns.
+    4. Creates a horizontal continuous scale bar plot to visualize the indicators.
+    """
+    _custom_title(
+        "Physical environment",
+        font_size=st.session_state["subtitle_size"],
+        source="ACAPS, INFORM Severity Index",
+        date=st.session_state["inform_severity_last_updated"],
+    )
+    final_df = country_inform_severity_data["physical_environment"]
+    if final_df is None:
+        st.markdown(f"No information available for {selected_country}")
+        return
 
     _create_horizontal_continous_scale_barplot(
         final_df,
@@ -208,39 +316,52 @@ def _show_physical_environment(selected_country: str):
     )
 
 
-@st.fragment
-def _show_impact_of_the_crisis(selected_country: str):
+def _compute_impact_of_the_crisis_maxes(
+    selected_country: str, last_modified_time: float
+) -> pd.DataFrame:
     """
-    Displays indicators related to the impact of the crisis using a horizontal continuous scale bar plot.
+    Computes the maximum values of the impact of the crisis indicators over the crises of the selected country.
+
+    Returns:
+    pd.DataFrame: The 'Value', 'Indicator' and 'Shown Value' columns.
 
     Operation:
-    1. Sets a custom title for the section.
-    2. Defines columns and their displayed values for the indicators.
-    3. Loads specific crisis-related data from an Excel sheet for impact indicators.
-    4. Calculates maximum values for the indicators and adjusts values for percentage display.
-    5. Prepares the data into a DataFrame with adjusted values and indicator labels.
-    6. Creates a horizontal continuous scale bar plot to visualize the indicators.
-    """
-    columns_to_shown_val = {
-        "% of total area affected": "% of total area affected",
-        "% of total population living in the affected area": "% of total population living\nin the affected area",
-        "% of total population displaced on the total population affected": "% of total population displaced\non the total population affected",  # noqa
-        "% of fatalities on the total population affected": "% of fatalities on\nthe total population affected",
-    }
+    1. Loads specific crisis-related data from an Excel sheet for the `columns_to_shown_val` impact indicators.
+    2. Calculates maximum values for the indicators and adjusts values for percentage display.
+    3. Builds the DataFrame directly from the adjusted values and indicator labels.
+    """
     columns = list(columns_to_shown_val.keys())
 
-    df = (
-        _load_crisis_specific_df_many_empty_rows(
-            selected_country, "Impact of the crisis", 3
-        )[columns]
-        .max(axis=0)
-        .to_frame()
-        .rename(columns={0: "Value"})
+    max_values = _load_crisis_specific_df_many_empty_rows(
+        selected_country, "Impact of the crisis", 3, last_modified_time
+    )[columns].max(axis=0)
+
+    # Capped at 100%, a country without data gets 100 (min keeps its first argument when
+    # compared to NaN), so the plot always has a valid maximum
+    values = [min(100, round(100 * x, 2)) for x in max_values.astype(float)]
+    return pd.DataFrame(
+        {
+            "Value": values,
+            "Indicator": list(columns_to_shown_val.values()),
+            "Shown Value": [f"{x}%" for x in values],
+        },
+        index=columns,
     )
-    df["Value"] = df["Value"].apply(lambda x: min(100, round(100 * x, 2)))
-    df["Indicator"] = df.index
-    df["Indicator"] = df["Indicator"].apply(lambda x: columns_to_shown_val.get(x, x))
-    df["Shown Value"] = df["Value"].apply(lambda x: f"{x}%")
+
+
+@st.fragment
+def _show_impact_of_the_crisis(
+    selected_country: str, country_inform_severity_data: Dict[str, Any]
+):
+    """
+    Displays indicators related to the impact of the crisis using a horizontal continuous scale bar plot.
+
+    Operation:
+    1. Gets the indicators maximum values from the data loaded by `_load_country_inform_severity_data`.
+    2. Sets a custom title for the section.
+    3. Creates a horizontal continuous scale bar plot to visualize the indicators.
+    """
+    df = country_inform_severity_data["impact_of_the_crisis"]
     max_val = df["Value"].max()
     _custom_title(
         "Impact of the crisis",
@@ -261,18 +382,45 @@ def _show_impact_of_the_crisis(selected_country: str):
     )
 
 
+def _compute_barriers_goods_services_maxes(
+    selected_country: str, last_modified_time: float
+) -> pd.DataFrame:
+    """
+    Computes the maximum values of the barriers to accessing goods and services indicators
+    over the crises of the selected country.
+
+    Returns:
+    pd.DataFrame: The 'Value' and 'Indicator' columns.
+
+    Operation:
+    1. Loads specific crisis-related data from an Excel sheet for the `columns_to_show_name` complexity indicators.
+    2. Calculates maximum values for the indicators.
+    3. Builds the DataFrame directly from the maximum values and indicator labels.
+    """
+    original_col_names = list(columns_to_show_name.keys())
+    max_values = _load_crisis_specific_df_many_empty_rows(
+        selected_country, "Complexity of the crisis", 3, last_modified_time
+    )[original_col_names].max(axis=0)
+
+    return pd.DataFrame(
+        {
+            "Value": max_values.to_numpy(),
+            "Indicator": list(columns_to_show_name.values()),
+        }
+    )
+
+
 @st.fragment
-def _show_barriers_goods_services(selected_country: str):
+def _show_barriers_goods_services(
+    selected_country: str, country_inform_severity_data: Dict[str, Any]
+):
     """
     Displays indicators related to barriers to accessing goods and services using a horizontal continuous scale bar plot.
 
     Operation:
     1. Sets a custom title for the section.
-    2. Defines columns and their displayed names for the indicators.
-    3. Loads specific crisis-related data from an Excel sheet for complexity indicators.
-    4. Calculates maximum values for the indicators.
-    5. Prepares the data into a DataFrame with adjusted values and indicator labels.
-    6. Creates a horizontal continuous scale bar plot to visualize the indicators.
+    2. Gets the indicators maximum values from the data loaded by `_load_country_inform_severity_data`.
+    3. Creates a horizontal continuous scale bar plot to visualize the indicators.
     """
     _custom_title(
         "Barriers to accessing good and services",
@@ -281,29 +429,8 @@ def _show_barriers_goods_services(selected_country: str):
         date=st.session_state["inform_severity_last_updated"],
     )
 
-    columns_to_show_name = {
-        "Ongoing insecurity/hostilities affecting humanitarian assistance": "Ongoing insecurity hostilities\naffecting humanitarian assistance",  # noqa
-        "Physical constraints in the environment (obstacles related to terrain, climate, lack of infrastructure, etc.)": "Physical constraints in the environment\n(obstacles related to terrain, climate,\nlack of infrastructure, etc.)",  # noqa
-        "Violence against personnel, facilities and assets": "Violence against personnel,\nfacilities and assets",
-        "Denial of existence of humanitarian needs or entitlements to assistance": "Denial of existence of humanitarian\nneeds or entitlements to assistance",  # noqa
-        "Presence of mines and improvised explosive devices": "Presence of mines and\nimprovised explosive devices",
-    }
-    original_col_names = list(columns_to_show_name.keys())
-    df = (
-        _load_crisis_specific_df_many_empty_rows(
-            selected_country, "Complexity of the crisis", 3
-        )[original_col_names]
-        .max(axis=0)
-        .to_frame()
-        .T
-    ).T.rename(columns={0: "Value"})
-
-    df["Indicator"] = df.index
-    df["Indicator"] = df["Indicator"].apply(lambda x: columns_to_show_name.get(x, x))
-    df.reset_index(drop=True, inplace=True)
-
     _create_horizontal_continous_scale_barplot(
-        df,
+        country_inform_severity_data["barriers_goods_services"],
         "Indicator",
         "Value",
         text_col="Value",
@@ -314,12 +441,54 @@ def _show_barriers_goods_services(selected_country: str):
     )
 
 
+@st.cache_data(show_spinner=False)
+def _load_country_inform_severity_data(
+    selected_country: str, last_modified_time: float
+) -> Dict[str, Any]:
+    """
+    Loads the INFORM Severity data shown in the country profile, once per country and file version.
+
+    Returns:
+    Dict[str, Any]: The crises list and the physical environment, impact of the crisis and
+    barriers to accessing goods and services indicators, passed to the display fragments.
+    """
+    return {
+        "crises": _get_list_of_crises(selected_country, last_modified_time),
+        "physical_environment": _compute_physical_environment_maxes(
+            selected_country, last_modified_time
+        ),
+        "impact_of_the_crisis": _compute_impact_of_the_crisis_maxes(
+            selected_country, last_modified_time
+        ),
+        "barriers_goods_services": _compute_barriers_goods_services_maxes(
+            selected_country, last_modified_time
+        ),
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def _get_inform_severity_data_by_country(
+    countries: Tuple[str, ...], last_modified_time: float
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Loads the country profile INFORM Severity data of all the countries once, shared by all the sessions,
+    so switching country is a dictionary lookup. The file modification time is passed down
+    to the cached per-country loaders.
+    """
+    return {
+        country: _load_country_inform_severity_data(country, last_modified_time)
+        for country in countries
+    }
+
+
 @st.fragment
-def _display_crises_list(selected_country: str):
+def _display_crises_list(
+    selected_country: str, country_inform_severity_data: Dict[str, Any]
+):
     """
     Function to display a list of crises from the INFORM Severity Index data.
     """
-    crises = _get_list_of_crises(selected_country)
+    crises = country_inform_severity_data["crises"]
     _custom_title(
         "Drivers (Crises)",
         st.session_state["subtitle_size"],
@@ -1,7 +1,28 @@
+import re
+
+import pandas as pd
 import streamlit as st
 from frontend.src.utils.utils_functions import (
     _add_blank_space, _custom_title, _display_bullet_point_as_highlighted_text,
-    _load_protection_indicators_data, _show_logo)
+    _get_protection_breakdown_df, _load_protection_indicators_data, _show_logo)
+
+
+def _get_evidence_text(evidence_df: pd.DataFrame) -> str:
+    """
+    Function to get the numbered evidence sources of a summary, built in one pass over the columns.
+    """
+    return "".join(
+        f"""{i}) {original_text} ([{name}]({link}) {date})\n\n"""
+        for i, (original_text, name, link, date) in enumerate(
+            zip(
+                evidence_df["Source Original Text"],
+                evidence_df["Source Name"],
+                evidence_df["Source Link"],
+                evidence_df["Source Date"],
+            ),
+            start=1,
+        )
+    )
 
 
 @st.fragment
@@ -19,16 +40,15 @@ def _display_main_summary(selected_country: str, display_evidence: bool = True):
     4. If `display_evidence` is True, also presents the evidence sources for the main summary.
     """
 
-    general_summary_df = st.session_state[f"protection_df_{selected_country}"][
-        st.session_state[f"protection_df_{selected_country}"]["Breakdown Column"]
-        == "1 - General Summary"
-    ]
+    general_summary_df = _get_protection_breakdown_df(
+        selected_country, "1 - General Summary"
+    )
     if len(general_summary_df) == 0:
         st.markdown(
             f"No information available for the protection summary for {selected_country}"
         )
         return
-    main_statement = general_summary_df["Generated Text"].values[0]
+    main_statement = general_summary_df["Generated Text"].iat[0]
 
     with st.container():
         if display_evidence:
@@ -42,15 +62,10 @@ def _display_main_summary(selected_country: str, display_evidence: bool = True):
                 _custom_title(
                     "Evidence", font_size=st.session_state["subsubtitle_size"]
                 )
-                evidence_text = ""
-                for i, (_, row) in enumerate(general_summary_df.iterrows()):
-                    relevant_text = f"""{i+1}) {row["Source Original Text"]}"""
-                    source = f""" ([{row['Source Name']}]({row['Source Link']}) {row['Source Date']})"""
-
-                    evidence_text += f"""{relevant_text}{source}\n\n"""
-
                 with st.container(height=250):
-                    st.markdown(evidence_text, unsafe_allow_html=True)
+                    st.markdown(
+                        _get_evidence_text(general_summary_df), unsafe_allow_html=True
+                    )
         else:
             st.write(main_statement)
 
@@ -73,10 +88,7 @@ def _display_detailed_summaries(selected_country: str, breakdown: str):
         font_size=st.session_state["subtitle_size"],
     )
 
-    detailed_summary_df = st.session_state[f"protection_df_{selected_country}"][
-        st.session_state[f"protection_df_{selected_country}"]["Breakdown Column"]
-        == breakdown
-    ]
+    detailed_summary_df = _get_protection_breakdown_df(selected_country, breakdown)
 
     values = detailed_summary_df["Value"].unique()
     for one_value in values:
@@ -85,17 +97,12 @@ def _display_detailed_summaries(selected_country: str, breakdown: str):
         with st.container():
             statement_col, _, evidence_col = st.columns([0.4, 0.02, 0.58])
             with statement_col:
-                st.write(df_one_value["Generated Text"].values[0])
+                st.write(df_one_value["Generated Text"].iat[0])
             with evidence_col:
-                evidence_text = ""
-                for i, (_, row) in enumerate(df_one_value.iterrows()):
-                    relevant_text = f"""{i+1}) {row["Source Original Text"]}"""
-                    source = f""" ([{row['Source Name']}]({row['Source Link']}) {row['Source Date']})"""
-
-                    evidence_text += f"""{relevant_text}{source}\n\n"""
-
                 with st.container(height=250):
-                    st.markdown(evidence_text, unsafe_allow_html=True)
+                    st.markdown(
+                        _get_evidence_text(df_one_value), unsafe_allow_html=True
+                    )
 
 
 @st.fragment
@@ -152,6 +159,36 @@ def _display_protection_data(selected_country: str):
     # _add_blank_space(2)
 
 
+child_related_tags = (
+    # "Abduction, kidnapping, enforced disappearances, or cases of missing people",
+    # "Access to asylum process after entry",
+    # "Arbitrary denial or deprivation of nationality or statelessness",
+    # "Arbitrary or unlawful arrest and/or detention",
+    "Child labour",
+    "Child trafficking, abduction or sale",
+    "Children being associated with armed forces or armed groups",
+    "Constraints on children’s education",
+    # "Extrajudicial executions, deliberate or indiscriminate attacks on civilians, and other unlawful killings",
+    # "Femicide and honour killings",
+    "Forced and/or early marriage",
+    # "Forced eviction from property",
+    "Forced family separation",
+    # "Forced labour or slavery",
+    # "Forced recruitment into armed forces or groups",
+    # "Human smuggling",
+    # "Human trafficking",
+    # "Refoulement/pushbacks/forced returns",
+    # "Sexual and gender-based violence",
+    # "Torture or inhumane, cruel, or degrading treatment",
+    # "Violence/abuse/intolerance towards individuals based on their sexual orientation, gender identity, and gender expression (SOGIE)"  # noqa
+)
+
+# Single alternation compiled once, so the tags are matched in one scan of the indicators
+child_related_tags_pattern = re.compile(
+    "|".join(re.escape(tag) for tag in child_related_tags)
+)
+
+
 @st.fragment
 def _display_specific_protection_indicators(selected_country: str):
     """
@@ -162,40 +199,14 @@ def _display_specific_protection_indicators(selected_country: str):
 
     Operation:
     1. Loads protection data specific to the selected country.
-    2. Retrieves and filters protection data based on specified child-related tags.
+    2. Retrieves and groups protection data by the specified child-related tags, matched in a single scan.
     3. Displays summaries for each specified protection indicator.
     4. If no information is available for a tag, it indicates so with a markdown message.
     """
-    child_related_tags = [
-        # "Abduction, kidnapping, enforced disappearances, or cases of missing people",
-        # "Access to asylum process after entry",
-        # "Arbitrary denial or deprivation of nationality or statelessness",
-        # "Arbitrary or unlawful arrest and/or detention",
-        "Child labour",
-        "Child trafficking, abduction or sale",
-        "Children being associated with armed forces or armed groups",
-        "Constraints on children’s education",
-        # "Extrajudicial executions, deliberate or indiscriminate attacks on civilians, and other unlawful killings",
-        # "Femicide and honour killings",
-        "Forced and/or early marriage",
-        # "Forced eviction from property",
-        "Forced family separation",
-        # "Forced labour or slavery",
-        # "Forced recruitment into armed forces or groups",
-        # "Human smuggling",
-        # "Human trafficking",
-        # "Refoulement/pushbacks/forced returns",
-        # "Sexual and gender-based violence",
-        # "Torture or inhumane, cruel, or degrading treatment",
-        # "Violence/abuse/intolerance towards individuals based on their sexual orientation, gender identity, and gender expression (SOGIE)"  # noqa
-    ]
     _load_protection_indicators_data(selected_country)
-    by_indicators_country_protection_df = st.session_state[
-        f"protection_df_{selected_country}"
-    ].copy()
-    by_indicators_country_protection_df = by_indicators_country_protection_df[
-        by_indicators_country_protection_df["Breakdown Column"] == "Indicator"
-    ][["Value", "Generated Text"]].drop_duplicates()
+    by_indicators_country_protection_df = _get_protection_breakdown_df(
+        selected_country, "Indicator"
+    )[["Value", "Generated Text"]].drop_duplicates()
     _custom_title(
         "Specific Protection Indicators Summaries",
         font_size=st.session_state["subtitle_size"],
@@ -203,14 +214,24 @@ def _display_specific_protection_indicators(selected_country: str):
         date=st.session_state[f"protection_df_max_date_{selected_country}"],
     )
 
+    # Tags found in each indicator, then the indicators grouped by tag
+    tagged_indicators_df = (
+        by_indicators_country_protection_df.assign(
+            tag=by_indicators_country_protection_df["Value"].str.findall(
+                child_related_tags_pattern
+            )
+        )
+        .explode("tag")
+        .drop_duplicates()
+    )
+    indicators_by_tag = dict(tuple(tagged_indicators_df.groupby("tag", sort=False)))
+
     columns = st.columns(2)
     for i, tag in enumerate(child_related_tags):
-        tag_df = by_indicators_country_protection_df[
-            by_indicators_country_protection_df["Value"].str.contains(tag)
-        ]
+        tag_df = indicators_by_tag.get(tag)
         with columns[i % 2]:
             _display_bullet_point_as_highlighted_text(tag, background_color="#BFDA95")
-            if len(tag_df) == 0:
+            if tag_df is None:
                 st.markdown(
                     f"No information available for this tag for {selected_country}"
                 )
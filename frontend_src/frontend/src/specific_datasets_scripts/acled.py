@@ -1,52 +1,114 @@
 import os
+from typing import Dict, Tuple
 
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.maps_creation import \
     _display_map_img  # _create_map_placeholder_plotly,
 
+# Columns of the individual events used by the filters and the events map
+individual_events_columns = [
+    "country",
+    "admin1",
+    "event_date",
+    "latitude",
+    "longitude",
+    "event_type",
+    "fatalities",
+]
+
+
+countries_mapping = {
+    "Central African Republic": "CAR",
+    "Democratic Republic of Congo": "Congo DRC",
+    "eSwatini": "Eswatini",
+    "Turkey": "Türkiye",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _load_number_of_events_targeting_civilians(
+    data_path: str, last_modified_time: float
+) -> pd.DataFrame:
+    """
+    Loads the yearly number of events targeting civilians of each country.
+    """
+    number_of_events_targeting_civilians_df = pd.read_csv(data_path)
+    # Categorical, so the country filter of every rerun compares integer codes
+    number_of_events_targeting_civilians_df["country"] = (
+        number_of_events_targeting_civilians_df["country"]
+        .replace(countries_mapping)
+        .astype("category")
+    )
+    return number_of_events_targeting_civilians_df
 
-def _load_acled_data():
 
-    number_of_events_targeting_civilians_countries_mapping = {
-        "Central African Republic": "CAR",
-        "Democratic Republic of Congo": "Congo DRC",
-        "eSwatini": "Eswatini",
-        "Turkey": "Türkiye",
-    }
-    number_of_events_targeting_civilians_df_path = os.path.join(
-        st.session_state["tabular_data_data_path"],
-        "acled",
-        "number_events_evolution.csv",
+@st.cache_resource(show_spinner=False)
+def _load_individual_events_by_country(
+    data_path: str, last_modified_time: float
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, Tuple[str]]]:
+    """
+    Loads the individual events targeting civilians and splits them by country once per file
+    version, with the event types of each country.
+    """
+    # Only the used columns are read, by the multithreaded pyarrow csv reader. Event dates are
+    # parsed once while reading, and the filtered columns are categorical so the equality
+    # filters compare integer codes
+    individual_events_targetting_civilians = pd.read_csv(
+        data_path,
+        engine="pyarrow",
+        usecols=individual_events_columns,
+        parse_dates=["event_date"],
+        dtype={"event_type": "category"},
     )
-
-    number_of_events_targeting_civilians_df = pd.read_csv(
-        number_of_events_targeting_civilians_df_path
+    individual_events_targetting_civilians["country"] = (
+        individual_events_targetting_civilians["country"]
+        .replace(countries_mapping)
+        .astype("category")
     )
-    number_of_events_targeting_civilians_df["country"] = (
-        number_of_events_targeting_civilians_df["country"].replace(
-            number_of_events_targeting_civilians_countries_mapping
+    # Events of each country sorted by date, so the date filter is a sorted index slice.
+    # Events without a date never pass the date filter and would break the sorting.
+    events_by_country = dict(
+        tuple(
+            individual_events_targetting_civilians.dropna(subset=["event_date"])
+            .sort_values("event_date")
+            .set_index("event_date", drop=False)
+            .groupby("country", sort=False, observed=True)
         )
     )
-    # st.dataframe(number_of_events_targeting_civilians_df)
+    # Event types of each country, built with the split so they always match the selected country
+    events_list_by_country = {
+        country: ("All",) + tuple(sorted(country_events_df["event_type"].unique()))
+        for country, country_events_df in events_by_country.items()
+    }
+    return events_by_country, events_list_by_country
 
-    st.session_state["number_of_events_targeting_civilians_df"] = (
-        number_of_events_targeting_civilians_df
+
+def _load_acled_data():
+    """
+    Loads the ACLED data in the session state, from the cached loaders.
+    """
+    acled_data_path = os.path.join(st.session_state["tabular_data_data_path"], "acled")
+    number_of_events_targeting_civilians_df_path = os.path.join(
+        acled_data_path, "number_events_evolution.csv"
+    )
+    individual_events_df_path = os.path.join(
+        acled_data_path, "individual_events_targetting_civilians_new.csv"
     )
 
-    st.session_state["individual_events_targetting_civilians"] = pd.read_csv(
-        os.path.join(
-            st.session_state["tabular_data_data_path"],
-            "acled",
-            "individual_events_targetting_civilians_new.csv",
+    st.session_state["number_of_events_targeting_civilians_df"] = (
+        _load_number_of_events_targeting_civilians(
+            number_of_events_targeting_civilians_df_path,
+            os.path.getmtime(number_of_events_targeting_civilians_df_path),
         )
     )
-    st.session_state["individual_events_targetting_civilians"]["country"] = (
-        st.session_state["individual_events_targetting_civilians"]["country"].replace(
-            number_of_events_targeting_civilians_countries_mapping
-        )
+    (
+        st.session_state["events_by_country"],
+        st.session_state["events_list_by_country"],
+    ) = _load_individual_events_by_country(
+        individual_events_df_path, os.path.getmtime(individual_events_df_path)
     )
     st.session_state["acled_last_updated"] = st.session_state[
         "number_of_events_targeting_civilians_df"
@@ -62,7 +124,7 @@ def _display_number_of_events_targetting_civilians(selected_country: str):
     1. Retrieves the dataframe containing the number of events targeting civilians for the selected country.
     2. Filters and sorts the dataframe based on the selected country and year.
     3. If data is available, sets a custom title for the chart.
-    4. Constructs a line chart using Altair to visualize the number of events over the years.
+    4. Constructs a WebGL line chart using Plotly to visualize the number of events over the years.
     """
 
     one_country_number_of_events_targeting_civilians = st.session_state[
@@ -70,7 +132,7 @@ def _display_number_of_events_targetting_civilians(selected_country: str):
     ][
         st.session_state["number_of_events_targeting_civilians_df"].country
         == selected_country
-    ].copy()
+    ]
     # st.dataframe(one_country_number_of_events_targeting_civilians)
 
     if len(one_country_number_of_events_targeting_civilians) > 0:
@@ -82,19 +144,21 @@ def _display_number_of_events_targetting_civilians(selected_country: str):
             source="ACLED",
             date=st.session_state["acled_last_updated"],
         )
-        fig = px.line(
-            one_country_number_of_events_targeting_civilians,
-            x="year",  # Use the same 'year' column as x-axis
-            y="Number of Events",  # Use the 'Number of Events' column as y-axis
-            title="",
-            labels={
-                "year": "Year",
-                "Number of Events": "Number of Events",
-            },
+        # WebGL line trace, drawn on a single canvas instead of SVG elements
+        fig = go.Figure(
+            go.Scattergl(
+                x=one_country_number_of_events_targeting_civilians["year"],
+                y=one_country_number_of_events_targeting_civilians["Number of Events"],
+                mode="lines",
+                line=dict(color="#86789C"),
+                hovertemplate="Year=%{x}<br>Number of Events=%{y}<extra></extra>",
+            )
         )
-        fig.update_traces(line=dict(color="#86789C"))
 
         fig.update_layout(
+            title="",
+            xaxis_title="Year",
+            yaxis_title="Number of Events",
             title_font=dict(size=1),  # Bigger title font
             xaxis_title_font=dict(size=18),  # Bigger x-axis title font
             yaxis_title_font=dict(size=18),  # Bigger y-axis title font
@@ -118,11 +182,14 @@ def _display_acled_map_data(selected_country: str):
     Operation:
     1. Sets a custom title for the map section displaying protection-related events.
     2. Constructs the path to the CSV file containing protection-related events data specific to the selected country.
-    3. Checks if the events dataset for the selected country is already loaded in session state. If not, loads and stores it.
-    4. Creates a dropdown to select event types from the loaded events dataset.
+    3. Checks if the events split by country and sorted by date in `_load_acled_data` have the selected country.
+       If not, displays a message and returns.
+    4. Creates a dropdown to select event types from the event types of the selected country,
+       listed once in `_load_acled_data`.
     5. Creates a dropdown to select a past date range (3 months, 6 months, or 1 year).
     6. Based on the selected past date range, calculates the start date for filtering events data.
-    7. Filters the displayed DataFrame (`displayed_df`) based on the selected event type and date range.
+    7. Filters the displayed DataFrame (`displayed_df`) based on the selected date range, with a slice of its sorted
+       date index, and on the selected event type.
     8. Displays the count of events and their characteristics (event type, date range, total events).
     9. Calls `_display_map_img` to visualize the filtered protection-related events on a map using PolyDeck (PDK).
     """
@@ -133,27 +200,11 @@ def _display_acled_map_data(selected_country: str):
         date=st.session_state["acled_last_updated"],
     )
 
-    if f"events_dataset_{selected_country}" not in st.session_state:
-
-        st.session_state[f"events_dataset_{selected_country}"] = st.session_state[
-            "individual_events_targetting_civilians"
-        ][
-            st.session_state["individual_events_targetting_civilians"].country
-            == selected_country
-        ]
-        if len(st.session_state[f"events_dataset_{selected_country}"]) == 0:
-            st.markdown(
-                f"No information available for the protection-related-events for {selected_country}"
-            )
-            return
-        st.session_state["events_list"] = (
-            st.session_state[f"events_dataset_{selected_country}"]["event_type"]
-            .unique()
-            .tolist()
-        )
-        st.session_state["events_list"] = ["All"] + sorted(
-            st.session_state["events_list"]
+    if selected_country not in st.session_state["events_by_country"]:
+        st.markdown(
+            f"No information available for the protection-related-events for {selected_country}"
         )
+        return
 
     with st.container():
         filter_col, date_range_col = st.columns([0.5, 0.5])
@@ -162,7 +213,7 @@ def _display_acled_map_data(selected_country: str):
 
             event_type = st.selectbox(
                 "Select Event Type",
-                st.session_state["events_list"],
+                st.session_state["events_list_by_country"][selected_country],
             )
         with date_range_col:
             past_date = st.selectbox(
@@ -180,9 +231,8 @@ def _display_acled_map_data(selected_country: str):
             elif past_date == "Past 2 years":
                 start_date = today_date - pd.DateOffset(months=24)
 
-    displayed_df = st.session_state[f"events_dataset_{selected_country}"].copy()
-    displayed_df["event_date"] = pd.to_datetime(displayed_df["event_date"])
-    displayed_df = displayed_df[displayed_df["event_date"] >= start_date]
+    displayed_df = st.session_state["events_by_country"][selected_country]
+    displayed_df = displayed_df.loc[start_date:]
     if event_type != "All":
         displayed_df = displayed_df[displayed_df["event_type"] == event_type]
 
@@ -1,37 +1,73 @@
+import os
+from typing import Dict, Optional
+
 import pandas as pd
 import streamlit as st
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.barchart import (_display_stackbar,
                                                   _get_abbreviated_number)
 
+age_groups = ["0-4", "5-11", "12-17", "18-59", "60+"]
 
-@st.fragment
-def _load_idmc_data():
+# Columns of the IDMC data used by the displacement results
+idmc_columns = ["Country", "Cause", "Sex", "Year"] + age_groups
+
+# IDMC country names renamed to the names used by the dashboard
+mapping_countries = {
+    "Dem. Rep. Congo": "Congo DRC",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _load_idmc_data(idmc_data_path: str, last_modified_time: float):
     """
-    Function to load the IDMC data from the Excel file.
+    Function to load the IDMC data from the parquet copy of its sheet, with only the used columns,
+    or from the Excel file if the parquet file was not generated yet or is older than the Excel file.
     """
-    mapping_countries = {
-        "Dem. Rep. Congo": "Congo DRC",
-    }
-    df = pd.read_excel(
-        st.session_state["idmc_data_path"], sheet_name="3_IDPs_SADD_estimates"
-    )
-    df["Country"] = df["Country"].apply(lambda x: mapping_countries.get(x, x))
+    parquet_path = f"{os.path.splitext(idmc_data_path)[0]}.parquet"
+    if (
+        os.path.exists(parquet_path)
+        and os.path.getmtime(parquet_path) >= last_modified_time
+    ):
+        df = pd.read_parquet(parquet_path, columns=idmc_columns)
+    else:
+        df = pd.read_excel(idmc_data_path, sheet_name="3_IDPs_SADD_estimates")
+    df["Country"] = df["Country"].map(mapping_countries).fillna(df["Country"])
     df = df[df["Country"].isin(st.session_state["countries"])]
+    # Only the kept countries remain, stored as a categorical for `_get_idmc_data_by_country`
+    df = df.assign(Country=df["Country"].astype("category"))
     return df
 
 
-def _display_one_cause_results(df: pd.DataFrame, displacement_cause: str):
+@st.cache_resource(show_spinner=False)
+def _get_idmc_data_by_country(
+    idmc_data_path: str, last_modified_time: float
+) -> Dict[str, pd.DataFrame]:
+    """
+    Function to split the IDMC data by country once, so a country selection is a dictionary lookup.
+    """
+    return dict(
+        tuple(
+            _load_idmc_data(idmc_data_path, last_modified_time).groupby(
+                "Country", sort=False, observed=True
+            )
+        )
+    )
+
+
+def _display_one_cause_results(cause_row: Optional[pd.Series], displacement_cause: str):
     """
     Displays results for displacement driven by a specific cause (either 'Conflict' or 'Disaster').
 
     Args:
-    - df (pd.DataFrame): DataFrame containing displacement data.
+    - cause_row (Optional[pd.Series]): Age groups values of the cause for both sexes in its latest year,
+      None if the country has no data for the cause.
     - displacement_cause (str): Cause of displacement ('Conflict' or 'Disaster').
 
     Operation:
     1. Sets a custom title for the displacement cause-driven displacement section.
-    2. Computes the total number of children displaced and total number of people displaced due to the specified cause.
+    2. Reads the age groups values of the cause row and computes the total number of children displaced
+       and total number of people displaced due to the specified cause.
     3. Constructs a dictionary `numbers_values` containing:
        - Title for children displaced due to the cause.
        - Original numbers including the number of children and total displaced people.
@@ -39,35 +75,27 @@ def _display_one_cause_results(df: pd.DataFrame, displacement_cause: str):
        - Plot size.
     4. Calls _display_stackbar() to visualize the stacked bar chart based on `numbers_values`.
     """
-    age_groups = ["0-4", "5-11", "12-17", "18-59", "60+"]
-
     _custom_title(
         f"{displacement_cause}-driven displacement",
         font_size=st.session_state["subsubtitle_size"],
     )
 
-    age_values = df[(df["Cause"] == displacement_cause) & (df.Sex == "Both sexes")]
-    if len(age_values)==0:
+    if cause_row is None:
         st.markdown(f"No data available for {displacement_cause.lower()} displacement")
         return
+    age_values = cause_row.to_numpy(dtype=float)
 
-    max_year = age_values["Year"].max()
-
-    age_values = age_values[age_values.Year == max_year]
-    if len(age_values)==0:
-        st.markdown(f"No data available for {displacement_cause.lower()} displacement")
-        return
-    age_values = age_values[age_groups].values[0]
-
-    if len(age_values) == 0 or sum(age_values) == 0:
+    # The age groups list is fixed, so the array is never empty: only a row of zeros has no data
+    if not age_values.any():
         st.markdown(f"No data available for {displacement_cause.lower()} displacement")
 
     else:
         # st.markdown(age_values)
-        children_number = sum(age_values[:3])
-        total_number = sum(age_values)
+        children_number = int(age_values[:3].sum())
+        total_number = int(age_values.sum())
 
-        ratio_children_displaced = round(children_number / total_number * 100)
+        inv_total_number = 100.0 / total_number
+        ratio_children_displaced = round(children_number * inv_total_number)
         numbers_values = {
             "title": f"Children displaced due to {displacement_cause.lower()}",
             "original_numbers": [
@@ -97,17 +125,18 @@ def _get_displacement_numbers(selected_country: str):
 
     Operation:
     1. Sets a custom title for the displacement section.
-    2. Retrieves the dataframe containing displacement data (IDMC, GRID) for the selected country.
-    3. Filters the dataframe based on the selected country.
-    4. If no data is available, displays a message indicating no data.
-    5. If data is available, displays results for both conflict and disaster causes using _display_one_cause_results().
+    2. Retrieves the dataframe containing displacement data (IDMC, GRID) for the selected country,
+       from the data split by country.
+    3. If no data is available, displays a message indicating no data.
+    4. If data is available, keeps the rows for both sexes and selects the row of the latest year of each cause once.
+    5. Displays results for both conflict and disaster causes using _display_one_cause_results(),
+       with the row of each cause.
     """
     source_name = "IDMC, GRID"
 
-    country_df = st.session_state["idmc_df"].copy()
-    country_df = country_df[country_df["Country"] == selected_country]
+    country_df = st.session_state["idmc_by_country"].get(selected_country)
 
-    if len(country_df) == 0:
+    if country_df is None:
         _custom_title(
             "Displacement",
             font_size=st.session_state["subtitle_size"],
@@ -123,15 +152,29 @@ def _get_displacement_numbers(selected_country: str):
         source=source_name,
         date=st.session_state["idmc_last_updated"],
     )
+    # Age groups of the latest row for both sexes of each cause, selected once for the two causes
+    both_sexes_df = country_df[country_df["Sex"] == "Both sexes"].dropna(
+        subset=["Year"]
+    )
+    latest_rows_by_cause = dict(
+        list(
+            both_sexes_df.loc[
+                both_sexes_df.groupby("Cause")["Year"].idxmax(), ["Cause"] + age_groups
+            ]
+            .set_index("Cause")
+            .iterrows()
+        )
+    )
+
     conflict_col, _, disaster_col = st.columns([0.47, 0.06, 0.47])
     with conflict_col:
         if len(country_df) > 0:
-            _display_one_cause_results(country_df, "Conflict")
+            _display_one_cause_results(latest_rows_by_cause.get("Conflict"), "Conflict")
         else:
             st.write("No conflict data available for this country")
 
     with disaster_col:
         if len(country_df) > 0:
-            _display_one_cause_results(country_df, "Disaster")
+            _display_one_cause_results(latest_rows_by_cause.get("Disaster"), "Disaster")
         else:
             st.write("No disaster data available for this country")
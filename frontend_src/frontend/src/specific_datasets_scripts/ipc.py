@@ -1,74 +1,85 @@
+from typing import Dict
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 import streamlit as st
 from frontend.src.utils.utils_functions import _custom_title
 from frontend.src.visualizations.barchart import (
     _create_horizontal_continous_scale_barplot, _get_abbreviated_number)
 
-
-def _load_preprocess_ipc_data():
+# IPC country abbreviations, and the reverse mapping to the country names
+countries_abbr = {
+    "Afghanistan": "AFG",
+    "Bangladesh": "BAN",
+    "Burkina Faso": "BFA",
+    "Burundi": "BDI",
+    "Cameroon": "CMR",
+    "Central African Republic": "CAR",
+    "Chad": "CHA",
+    "Colombia": "COL",
+    "Congo DRC": "COD",
+    "Ecuador": "ECU",
+    "El Salvador": "SLV",
+    "Ethiopia": "ETH",
+    "Guatemala": "GTM",
+    "Haiti": "HTI",
+    "Honduras": "HON",
+    "Iran": "IRN",
+    "Iraq": "IRQ",
+    "Jordan": "JOR",
+    "Kenya": "KEN",
+    "Lebanon": "LBN",
+    "Libya": "LBY",
+    "Madagascar": "MAD",
+    "Malawi": "MWI",
+    "Mali": "MLI",
+    "Mexico": "MEX",
+    "Mozambique": "MOZ",
+    "Myanmar": "MMR",
+    "Nepal": "NEP",
+    "Nicaragua": "NIC",
+    "Niger": "NIG",
+    "Nigeria": "NGA",
+    "Pakistan": "PAK",
+    "Palestine": "PAL",
+    "Peru": "PER",
+    "Philippines": "PHI",
+    "Somalia": "SOM",
+    "South Sudan": "SSD",
+    "Sudan": "SUD",
+    "Syria": "SYR",
+    "Türkiye": "TUR",
+    "Ukraine": "UKR",
+    "Venezuela": "VEN",
+    "Yemen": "YEM",
+    "Zimbabwe": "ZIM",
+}
+abrev2country = {v: k for k, v in countries_abbr.items()}
+
+
+@st.cache_data(show_spinner=False)
+def _load_preprocess_ipc_data(ipc_data_path: str, last_modified_time: float):
     """
     Loads and preprocesses IPC (Integrated Food Security Phase Classification) data.
 
     Operation:
-    1. Defines a dictionary mapping countries to their abbreviations.
-    2. Creates a reverse dictionary to map abbreviations back to country names.
+    1. Uses the module dictionary mapping countries to their abbreviations.
+    2. Uses the module reverse dictionary to map abbreviations back to country names.
     3. Specifies relevant columns to read from the IPC data file.
-    4. Reads the IPC data file into a DataFrame, skipping the first row.
-    5. Filters the DataFrame to include only current validity period and Phase 3+ (food insecurity).
+    4. Reads the IPC data file with the pyarrow csv reader, skipping the first row, parsing
+       the 'Number' column as integers and the 'Validity period' and 'Phase' columns as categories.
+    5. Filters the table to include only current validity period and Phase 3+ (food insecurity),
+       before converting it to a DataFrame.
     6. Renames columns for clarity.
-    7. Converts the 'Number of Food Insecure People' column to integer type.
+    7. Keeps the 'Number of Food Insecure People' column as parsed, already of integer type.
     8. Maps abbreviated country names to full country names using the reverse dictionary.
     9. Filters the DataFrame to include only countries in the session state.
-    10. Returns the preprocessed DataFrame.
+    10. Parses the analysis dates into 'Formatted Date', and its display string into 'Formatted Date String'.
+        Converts the 'Country' column to a categorical column.
+    11. Returns the preprocessed DataFrame.
     """
-    countries_abbr = {
-        "Afghanistan": "AFG",
-        "Bangladesh": "BAN",
-        "Burkina Faso": "BFA",
-        "Burundi": "BDI",
-        "Cameroon": "CMR",
-        "Central African Republic": "CAR",
-        "Chad": "CHA",
-        "Colombia": "COL",
-        "Congo DRC": "COD",
-        "Ecuador": "ECU",
-        "El Salvador": "SLV",
-        "Ethiopia": "ETH",
-        "Guatemala": "GTM",
-        "Haiti": "HTI",
-        "Honduras": "HON",
-        "Iran": "IRN",
-        "Iraq": "IRQ",
-        "Jordan": "JOR",
-        "Kenya": "KEN",
-        "Lebanon": "LBN",
-        "Libya": "LBY",
-        "Madagascar": "MAD",
-        "Malawi": "MWI",
-        "Mali": "MLI",
-        "Mexico": "MEX",
-        "Mozambique": "MOZ",
-        "Myanmar": "MMR",
-        "Nepal": "NEP",
-        "Nicaragua": "NIC",
-        "Niger": "NIG",
-        "Nigeria": "NGA",
-        "Pakistan": "PAK",
-        "Palestine": "PAL",
-        "Peru": "PER",
-        "Philippines": "PHI",
-        "Somalia": "SOM",
-        "South Sudan": "SSD",
-        "Sudan": "SUD",
-        "Syria": "SYR",
-        "Türkiye": "TUR",
-        "Ukraine": "UKR",
-        "Venezuela": "VEN",
-        "Yemen": "YEM",
-        "Zimbabwe": "ZIM",
-    }
-    abrev2country = {v: k for k, v in countries_abbr.items()}
-
     relevant_cols = [
         "Date of analysis",
         "Country",
@@ -77,23 +88,66 @@ def _load_preprocess_ipc_data():
         "Phase",
         "Number",
     ]
-    df = pd.read_csv(st.session_state["ipc_data_path"], usecols=relevant_cols).iloc[1:]
-    df = df[(df["Validity period"] == "current") & (df["Phase"] == "3+")].rename(
+    # Read in one pass by the pyarrow csv reader: the row under the header is skipped, so the
+    # numbers are parsed as integers, and the rows are filtered before building the DataFrame.
+    # The filtered columns only have a few distinct values, so they are dictionary encoded.
+    ipc_table = pacsv.read_csv(
+        ipc_data_path,
+        read_options=pacsv.ReadOptions(skip_rows_after_names=1),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=relevant_cols,
+            column_types={
+                "Number": pa.int64(),
+                "Validity period": pa.dictionary(pa.int32(), pa.string()),
+                "Phase": pa.dictionary(pa.int32(), pa.string()),
+            },
+        ),
+    )
+    ipc_table = ipc_table.filter(
+        pc.and_(
+            pc.equal(ipc_table["Validity period"], "current"),
+            pc.equal(ipc_table["Phase"], "3+"),
+        )
+    )
+    df = ipc_table.to_pandas().rename(
         columns={
             "Country": "Country abrv",
             "Level 1": "Region Name",
             "Number": "Number of Food Insecure People",
         }
     )
-    df["Number of Food Insecure People"] = df["Number of Food Insecure People"].astype(
-        int
-    )
-    df["Country"] = df["Country abrv"].apply(lambda x: abrev2country.get(x, x))
+    df["Country"] = df["Country abrv"].map(abrev2country).fillna(df["Country abrv"])
     df = df[df["Country"].isin(st.session_state["countries"])]
+    # Analysis dates parsed once here instead of at every render of a country
+    formatted_date = pd.to_datetime(df["Date of analysis"], format="%b %Y", cache=True)
+    # Categorical country, grouped on its integer codes by `_get_ipc_data_by_country`
+    df = df.assign(
+        **{
+            "Country": df["Country"].astype("category"),
+            "Formatted Date": formatted_date,
+            "Formatted Date String": formatted_date.dt.strftime("%b %Y"),
+        }
+    )
     # st.dataframe(df)
     return df
 
 
+@st.cache_resource(show_spinner=False)
+def _get_ipc_data_by_country(
+    ipc_data_path: str, last_modified_time: float
+) -> Dict[str, pd.DataFrame]:
+    """
+    Splits the preprocessed IPC data by country once, so a country selection is a dictionary lookup.
+    """
+    return dict(
+        tuple(
+            _load_preprocess_ipc_data(ipc_data_path, last_modified_time).groupby(
+                "Country", sort=False, observed=True
+            )
+        )
+    )
+
+
 @st.fragment
 def _plot_ipc_results(selected_country: str):
     """
@@ -101,8 +155,9 @@ def _plot_ipc_results(selected_country: str):
 
     Operation:
     1. Sets a custom title for the Food Insecurity section.
-    2. Copies and filters the IPC DataFrame for the selected country.
+    2. Gets the IPC DataFrame of the selected country from the data split by country.
     3. Checks if data is available for the selected country; if not, displays a message and returns.
+       Keeps the rows of the latest analysis date, parsed once when loading the data.
     4. Sorts the filtered DataFrame by the number of food insecure people in ascending order.
     5. Adds a column 'Shown Number' with abbreviated numbers for display.
     6. Computes the maximum value for the bar plot based on the number of food insecure people.
@@ -113,24 +168,20 @@ def _plot_ipc_results(selected_country: str):
        - Custom color, title, x-axis and y-axis titles.
     """
 
-    ipc_one_country_values_df = st.session_state["ipc_df"].copy()
-    ipc_one_country_values_df = ipc_one_country_values_df[
-        ipc_one_country_values_df["Country"] == selected_country
-    ]
-    if len(ipc_one_country_values_df) == 0:
+    ipc_one_country_values_df = st.session_state["ipc_by_country"].get(selected_country)
+    if ipc_one_country_values_df is None:
         _custom_title(
             "Food Insecurity", font_size=st.session_state["subtitle_size"], source="IPC"
         )
         st.markdown(f"No Information for Food Security for {selected_country}")
         return
 
-    ipc_one_country_values_df["Formatted Date"] = pd.to_datetime(
-        ipc_one_country_values_df["Date of analysis"], format="%b %Y"
-    )
+    max_date_idx = ipc_one_country_values_df["Formatted Date"].idxmax()
+    max_date = ipc_one_country_values_df.at[max_date_idx, "Formatted Date"]
 
-    max_date = ipc_one_country_values_df["Formatted Date"].max()
-
-    st.session_state[f"max_date_ipc_{selected_country}"] = max_date.strftime("%b %Y")
+    st.session_state[f"max_date_ipc_{selected_country}"] = ipc_one_country_values_df.at[
+        max_date_idx, "Formatted Date String"
+    ]
 
     ipc_one_country_values_df = ipc_one_country_values_df[
         ipc_one_country_values_df["Formatted Date"] == max_date
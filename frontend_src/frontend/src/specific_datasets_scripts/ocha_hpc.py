@@ -1,7 +1,9 @@
+import os
+from typing import Dict
+
 import pandas as pd
 import streamlit as st
-from frontend.src.utils.utils_functions import (_add_commas, _custom_title,
-                                                _get_percentage)
+from frontend.src.utils.utils_functions import _custom_title, _get_percentage
 from frontend.src.visualizations.barchart import (  # _create_horizontal_single_scale_barplot,
     _create_horizontal_continous_scale_barplot, _create_vertical_barplot,
     _display_stackbar, _get_abbreviated_number)
@@ -15,12 +17,12 @@ def _display_top_countries_with_children_in_need(n_kept_countries: int = 10):
     - n_kept_countries (int, optional): Number of top countries to display. Defaults to 10.
 
     Operation:
-    1. Copies and sorts the 'country_wise_children_in_need_data' DataFrame from session
+    1. Sorts the 'country_wise_children_in_need_data' DataFrame from session
        state by 'proportion_children_in_need' in ascending order.
     2. Selects the top 'n_kept_countries' countries with the lowest proportion of children in need.
     3. Calculates the maximum value of 'proportion_children_in_need' from the sorted DataFrame.
-    4. Converts 'proportion_children_in_need' values to percentages using the '_get_percentage'
-       function and adds to 'shown_proportion_children_in_need' column.
+    4. Converts 'proportion_children_in_need' values to whole percentages and adds them as strings
+       to the 'shown_proportion_children_in_need' column.
     5. Calls '_create_horizontal_single_scale_barplot' function to create and display a horizontal single-scale bar plot:
     - Uses 'sorted_df' DataFrame with columns 'country', 'proportion_children_in_need',
       and 'shown_proportion_children_in_need'.
@@ -33,23 +35,26 @@ def _display_top_countries_with_children_in_need(n_kept_countries: int = 10):
     - None
     """
 
-    sorted_df = (
+    top_countries_df = (
         st.session_state["country_wise_children_in_need_data"]
-        .copy()
         .sort_values(by="proportion_children_in_need", ascending=False)[
             ["country", "proportion_children_in_need"]
         ]
         .head(n_kept_countries)
         .iloc[::-1]
     )
-    sorted_df["proportion_children_in_need"] = (
-        sorted_df["proportion_children_in_need"] * 100
-    )
+    proportion_children_in_need = top_countries_df["proportion_children_in_need"] * 100
     # max_val = sorted_df["proportion_children_in_need"].max()  # * 100
+    # The proportions have two decimals, so the percentages are whole numbers
+    shown_proportion_children_in_need = (
+        proportion_children_in_need.round(0).astype(int).astype(str) + "%"
+    )
 
-    sorted_df["shown_proportion_children_in_need"] = sorted_df[
-        "proportion_children_in_need"
-    ].apply(lambda x: f"{x}%")
+    # The derived columns are added to a new dataframe, the sorted slice is not modified
+    sorted_df = top_countries_df.assign(
+        proportion_children_in_need=proportion_children_in_need,
+        shown_proportion_children_in_need=shown_proportion_children_in_need,
+    )
     # sorted_df["shown_proportion_children_in_need"] = sorted_df[
     #     "proportion_children_in_need"
     # ].apply(_get_percentage)
@@ -84,7 +89,7 @@ def _display_evolution_data():
     aggregated by year across countries.
 
     Operation:
-    1. Copies and filters the 'all_pin_data' DataFrame from session state to include
+    1. Filters the 'all_pin_data' DataFrame from session state to include
        columns 'country', 'year', and 'children_in_need', dropping rows with missing values.
     2. Groups the filtered DataFrame 'df' by 'year', aggregating:
     - 'children_in_need' to calculate the sum of children in need per year.
@@ -92,7 +97,8 @@ def _display_evolution_data():
     3. Resets the index of the grouped DataFrame 'grouped_df' and renames columns to
        'Sum of children in need' and 'Number of countries'.
     4. Formats 'year' column values as strings with a trailing colon ':' for display purposes.
-    5. Creates a 'Text' column in 'grouped_df' combining abbreviated sum of children in need and count of countries.
+    5. Creates a 'Text' column in 'grouped_df' combining abbreviated sum of children in need and count of countries,
+       with column-wise string concatenation.
     6. Calls '_create_vertical_barplot' function to generate and display a vertical bar plot:
     - Uses 'grouped_df' DataFrame with columns 'year', 'Sum of children in need', and 'Text'.
     - Specifies 'labels_col' as 'year', 'numbers_col' as 'Sum of children in need', and 'text_col' as 'Text'.
@@ -104,11 +110,9 @@ def _display_evolution_data():
 
     """
 
-    df = (
-        st.session_state["all_pin_data"]
-        .copy()[["country", "year", "children_in_need"]]
-        .dropna()
-    )
+    df = st.session_state["all_pin_data"][
+        ["country", "year", "children_in_need"]
+    ].dropna()
     # group by year and keep three columns, one for the year,
     # one for the sum of children in need and one for the number of country
     grouped_df = (
@@ -124,9 +128,11 @@ def _display_evolution_data():
     )
     grouped_df["year"] = grouped_df["year"].apply(lambda x: f"{int(x)}")
 
-    grouped_df["Text"] = grouped_df.apply(
-        lambda x: f"{_get_abbreviated_number(x['Sum of children in need'])}\n({x['Number of countries']} Countries)",
-        axis=1,
+    grouped_df["Text"] = (
+        grouped_df["Sum of children in need"].map(_get_abbreviated_number)
+        + "\n("
+        + grouped_df["Number of countries"].astype(str)
+        + " Countries)"
     )
 
     _create_vertical_barplot(
@@ -141,51 +147,54 @@ def _display_evolution_data():
     )
 
 
-def _get_total_CP_caseload_in_need():
+@st.cache_data(show_spinner=False)
+def _get_total_CP_caseload_in_need(df: pd.DataFrame):
     """
     Calculates and returns the total number of children in need across
     countries and the number of countries reporting children in need.
 
+    Args:
+    - df (pd.DataFrame): Country-wise PIN data ('country_wise_pin_data' in session state).
+
     Returns:
-    - Tuple[str, int]: A tuple containing:
-    - Total number of children in need formatted with commas.
+    - Tuple[int, int]: A tuple containing:
+    - Total number of children in need.
     - Number of countries reporting children in need.
 
     Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Computes the sum of 'children_in_need' column values in 'df'
+    1. Computes the sum of 'children_in_need' column values in 'df'
        to get the total number of children in need.
-    3. Counts the number of countries in 'df' where 'children_in_need' values
-       are not NaN to determine the number of reporting countries.
-    4. Formats the total number of children in need using '_add_commas' function for readability.
-    5. Returns a tuple with the formatted total number of children in
+    2. Counts the 'children_in_need' values that are not NaN
+       to determine the number of reporting countries.
+    3. Returns a tuple with the total number of children in
        need and the count of reporting countries.
     """
 
-    df = st.session_state["country_wise_pin_data"].copy()
     total_number_of_children_in_need = int(df["children_in_need"].sum())
-    n_countries = df[df["children_in_need"].notna()].shape[0]
-    return _add_commas(total_number_of_children_in_need), n_countries
+    n_countries = int(df["children_in_need"].notna().sum())
+    return total_number_of_children_in_need, n_countries
 
 
-def _get_ratio_children_in_need_to_pop_in_need():
+@st.cache_data(show_spinner=False)
+def _get_ratio_children_in_need_to_pop_in_need(df: pd.DataFrame):
     """
     Calculates the ratio of children in need to total population in need across countries reporting both values.
 
+    Args:
+    - df (pd.DataFrame): Country-wise PIN data ('country_wise_pin_data' in session state).
+
     Returns:
     - Tuple[str, int]: A tuple containing:
     - Ratio of children in need to total population in need formatted as a percentage.
     - Number of countries with available data for both children in need and total population in need.
 
     Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Filters 'df' to include rows where both 'children_in_need' and 'tot_pop_in_need' columns are not NaN.
-    3. Computes the ratio of the sum of 'children_in_need' to the sum of 'tot_pop_in_need' in 'df'.
-    4. Formats the ratio as a percentage using the '_get_percentage' function.
-    5. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
-    6. Returns a tuple with the formatted ratio and the count of countries with available data.
+    1. Filters 'df' to include rows where both 'children_in_need' and 'tot_pop_in_need' columns are not NaN.
+    2. Computes the ratio of the sum of 'children_in_need' to the sum of 'tot_pop_in_need' in 'df'.
+    3. Formats the ratio as a percentage using the '_get_percentage' function.
+    4. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
+    5. Returns a tuple with the formatted ratio and the count of countries with available data.
     """
-    df = st.session_state["country_wise_pin_data"].copy()
     df = df[(df["tot_pop_in_need"].notna()) & (df["children_in_need"].notna())]
     ratio = df["children_in_need"].sum() / df["tot_pop_in_need"].sum()
     ratio = _get_percentage(ratio)
@@ -193,25 +202,27 @@ def _get_ratio_children_in_need_to_pop_in_need():
     return ratio, number_of_countries
 
 
-def _get_ratio_children_targeted_to_children_in_need():
+@st.cache_data(show_spinner=False)
+def _get_ratio_children_targeted_to_children_in_need(df: pd.DataFrame):
     """
     Calculates the ratio of targeted children to children in need across countries reporting both values.
 
+    Args:
+    - df (pd.DataFrame): Country-wise PIN data ('country_wise_pin_data' in session state).
+
     Returns:
     - Tuple[str, int]: A tuple containing:
     - Ratio of targeted children to children in need formatted as a percentage.
     - Number of countries with available data for both targeted children and children in need.
 
     Operation:
-    1. Copies the 'country_wise_pin_data' DataFrame from session state into 'df'.
-    2. Filters 'df' to include rows where both 'targeted_children' and 'children_in_need' columns are not NaN.
-    3. Computes the ratio of the sum of 'targeted_children' to the sum of 'children_in_need' in 'df'.
-    4. Formats the ratio as a percentage using the '_get_percentage' function.
-    5. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
-    6. Returns a tuple with the formatted ratio and the count of countries with available data.
+    1. Filters 'df' to include rows where both 'targeted_children' and 'children_in_need' columns are not NaN.
+    2. Computes the ratio of the sum of 'targeted_children' to the sum of 'children_in_need' in 'df'.
+    3. Formats the ratio as a percentage using the '_get_percentage' function.
+    4. Counts the number of rows (countries) in the filtered 'df' to determine the number of countries with available data.
+    5. Returns a tuple with the formatted ratio and the count of countries with available data.
     """
 
-    df = st.session_state["country_wise_pin_data"].copy()
     df = df[(df["targeted_children"].notna()) & (df["children_in_need"].notna())]
     ratio = df["targeted_children"].sum() / df["children_in_need"].sum()
     ratio = _get_percentage(ratio)
@@ -219,6 +230,27 @@ def _get_ratio_children_targeted_to_children_in_need():
     return ratio, number_of_countries
 
 
+def _get_pin_data_last_modified_time(pin_df_path: str) -> float:
+    """
+    Modification time of the PIN file read by `_load_pin_data`, the parquet file or its CSV fallback.
+    """
+    if os.path.exists(pin_df_path):
+        return os.path.getmtime(pin_df_path)
+    return os.path.getmtime(f"{os.path.splitext(pin_df_path)[0]}.csv")
+
+
+@st.cache_data(show_spinner=False)
+def _load_pin_data(pin_df_path: str, last_modified_time: float) -> pd.DataFrame:
+    """
+    Loads the OCHA HPC PIN (People in Need) data from its parquet file,
+    or from the CSV file if the parquet file was not generated yet.
+    """
+    if os.path.exists(pin_df_path):
+        return pd.read_parquet(pin_df_path)
+    return pd.read_csv(f"{os.path.splitext(pin_df_path)[0]}.csv")
+
+
+@st.cache_data(show_spinner=False)
 def _get_country_wise_pin_data(df: pd.DataFrame):
     """
     Extracts and returns country-wise PIN (People in Need) data for the specified year from the provided DataFrame.
@@ -236,12 +268,13 @@ def _get_country_wise_pin_data(df: pd.DataFrame):
     - 'tot_pop_in_need': Total population in need.
 
     Operation:
-    1. Copies and filters the input DataFrame 'df' to include data only for the year 2024.
-    2. Filters rows based on non-null values in columns related to children in need,
+    1. Filters the input DataFrame 'df' to include data only for the year 2024.
+    2. Drops the rows without any value in the columns related to children in need,
        targeted children, and total population in need.
     3. Sorts and resets the index of the resulting DataFrame 'all_pin_data' for clarity and consistency.
     4. Selects relevant columns ('country', 'year', 'children_in_need',
        'targeted_children', 'tot_pop_in_need') from the filtered data.
+    5. Converts the 'country' column to a categorical column.
     """
     # country_wise_results = pd.DataFrame()
 
@@ -251,14 +284,12 @@ def _get_country_wise_pin_data(df: pd.DataFrame):
     #     "tot_pop_in_need",
     # ]
 
-    all_pin_data = df.copy()
-    all_pin_data = all_pin_data[all_pin_data["year"] == 2024]
+    all_pin_data = df[df["year"] == 2024]
     all_pin_data = (
-        all_pin_data[
-            (~all_pin_data["children_in_need"].isna())
-            | (~all_pin_data["targeted_children"].isna())
-            | (~all_pin_data["tot_pop_in_need"].isna())
-        ]
+        all_pin_data.dropna(
+            subset=["children_in_need", "targeted_children", "tot_pop_in_need"],
+            how="all",
+        )
         .sort_values(by=["country", "year"])
         .reset_index(drop=True)
     )
@@ -266,10 +297,32 @@ def _get_country_wise_pin_data(df: pd.DataFrame):
     all_pin_data = all_pin_data[
         ["country", "year", "children_in_need", "targeted_children", "tot_pop_in_need"]
     ]
+    # Categorical, for the split of the country-wise data in `_get_country_wise_pin_data_by_country`
+    all_pin_data = all_pin_data.assign(
+        country=all_pin_data["country"].astype("category")
+    )
 
     return all_pin_data
 
 
+@st.cache_resource(show_spinner=False)
+def _get_country_wise_pin_data_by_country(
+    pin_df_path: str, last_modified_time: float
+) -> Dict[str, pd.DataFrame]:
+    """
+    Splits the country-wise PIN (People in Need) data by country once per file version,
+    so a country selection is a dictionary lookup.
+    """
+    return dict(
+        tuple(
+            _get_country_wise_pin_data(
+                _load_pin_data(pin_df_path, last_modified_time)
+            ).groupby("country", sort=False, observed=True)
+        )
+    )
+
+
+@st.cache_data(show_spinner=False)
 def _get_country_wise_children_in_need_data(df: pd.DataFrame):
     """
     Calculates and returns country-wise data on children in need based on the provided DataFrame.
@@ -288,60 +341,56 @@ def _get_country_wise_children_in_need_data(df: pd.DataFrame):
     Operation:
     1. Extracts relevant columns ('country', 'year', 'children_in_need', 'tot_pop_in_need')
        from the input DataFrame.
-    2. Iterates over each unique country to calculate statistics:
-    - Selects the most recent data entry for each country based on year.
-    - Computes the proportion of children in need to total population in need.
-    3. Constructs a new DataFrame 'country_wise_results' with calculated values for each country.
+    2. Selects the most recent data entry for each country, with a single groupby over the data.
+    3. Computes the proportion of children in need to total population in need, for all the countries at once.
     """
-    country_wise_results = pd.DataFrame()
-
-    all_pin_data = df.copy()[
+    all_pin_data = df[
         ["country", "year", "children_in_need", "tot_pop_in_need"]
     ].dropna()
 
-    for one_country in all_pin_data.country.unique():
-        one_country_df = all_pin_data[all_pin_data.country == one_country]
-        one_col_one_country_df = one_country_df.sort_values(
-            "year", ascending=False
-        ).iloc[0]
-        results_one_country = {"country": one_country}
-
-        results_one_col = round(
-            one_col_one_country_df["children_in_need"]
-            / one_col_one_country_df["tot_pop_in_need"],
-            2,
-        )
-        results_one_country["children_in_need"] = int(
-            one_col_one_country_df["children_in_need"]
-        )
-        results_one_country["proportion_children_in_need"] = results_one_col
-        results_one_country["year"] = one_col_one_country_df["year"]
-        country_wise_results = country_wise_results._append(
-            results_one_country, ignore_index=True
-        )
-
-    return country_wise_results
+    # Row of the latest year of each country, countries kept in their order of appearance
+    latest_rows = all_pin_data.groupby("country", sort=False)["year"].idxmax()
+    country_wise_results = all_pin_data.loc[latest_rows]
+
+    return pd.DataFrame(
+        {
+            "country": country_wise_results["country"],
+            "children_in_need": country_wise_results["children_in_need"].astype(int),
+            "proportion_children_in_need": (
+                country_wise_results["children_in_need"]
+                / country_wise_results["tot_pop_in_need"]
+            ).round(2),
+            "year": country_wise_results["year"],
+        }
+    ).reset_index(drop=True)
 
 
+@st.fragment
 def _display_pin_stackbar(selected_country: str):
     """
     Displays a stacked bar chart visualizing information about children in need for the selected country.
 
     Operation:
-    1. Retrieves country-specific data related to children in need from session state.
-    2. Computes percentages and formats numbers for targeted children, children in need, and total people in need.
+    1. Retrieves country-specific data related to children in need from the session state data split by country.
+    2. Reads the values of the country row once, and computes the percentages of children targeted
+       and in need once.
+       Computes percentages and formats numbers for targeted children, children in need, and total people in need.
     3. Displays a stacked bar chart with annotations representing the proportions of
        targeted children, children in need, and total people in need.
     4. Includes a title and source annotation for the visualization.
     """
-    country_informations = st.session_state["country_wise_pin_data"]
-    country_specific_df = country_informations[
-        country_informations["country"] == selected_country
-    ]
-    if len(country_specific_df) > 0:
-        children_in_need = country_specific_df["children_in_need"].values[0]
-        children_targeted = country_specific_df["targeted_children"].values[0]
-        total_people_in_need = country_specific_df["tot_pop_in_need"].values[0]
+    country_specific_df = st.session_state["country_wise_pin_data_by_country"].get(
+        selected_country
+    )
+    if country_specific_df is not None:
+        country_row = country_specific_df.iloc[0]
+        children_in_need = country_row["children_in_need"]
+        children_targeted = country_row["targeted_children"]
+        total_people_in_need = country_row["tot_pop_in_need"]
+        # Percentages of the total people in need, with the division done once
+        inv_total_people_in_need = 100.0 / total_people_in_need
+        ratio_children_targeted = round(children_targeted * inv_total_people_in_need)
+        ratio_children_in_need = round(children_in_need * inv_total_people_in_need)
 
         numbers_values = {
             "title": "Child Protection Caseload (in Need)",
@@ -350,13 +399,13 @@ def _display_pin_stackbar(selected_country: str):
                     "value": children_targeted,
                     "label": f"CP\nCaseload\ntargeted\n{_get_abbreviated_number(children_targeted)}",
                     "color": "#9FD5B5",
-                    "number_annotation": f"{round(children_targeted / total_people_in_need * 100)}%",
+                    "number_annotation": f"{ratio_children_targeted}%",
                 },
                 {
                     "value": children_in_need,
                     "label": f"CP Caseload\nin Need\n{_get_abbreviated_number(children_in_need)}",
                     "color": "#90AF95",
-                    "number_annotation": f"{round(children_in_need / total_people_in_need * 100)}%",
+                    "number_annotation": f"{ratio_children_in_need}%",
                 },
                 {
                     "value": total_people_in_need,
@@ -365,7 +414,7 @@ def _display_pin_stackbar(selected_country: str):
                     "number_annotation": f"100%: {_get_abbreviated_number(total_people_in_need)}\nPeople in need",
                 },
             ],
-            "annotation": f"\n\n\n\n{round(children_in_need / total_people_in_need * 100)}% ({_get_abbreviated_number(children_in_need)}) of people are in Need of CP Services. ",  # noqa
+            "annotation": f"\n\n\n\n{ratio_children_in_need}% ({_get_abbreviated_number(children_in_need)}) of people are in Need of CP Services. ",  # noqa
             "plot_size": (10, 2.5),
         }
         _custom_title(
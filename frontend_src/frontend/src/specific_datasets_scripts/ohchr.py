@@ -1,11 +1,11 @@
 import os
 import re
+from typing import Dict
 
 import pandas as pd
 import streamlit as st
 from frontend.src.utils.utils_functions import (
-    _add_blank_space, _convert_to_datetime, _custom_title,
-    _display_bullet_point_as_highlighted_text)
+    _add_blank_space, _custom_title, _display_bullet_point_as_highlighted_text)
 
 yes_color = "#95C651"
 no_color = "#86789C"
@@ -22,16 +22,55 @@ def _replace_special_chars(input_string):
     return replaced_string
 
 
-def _load_country_summaries_indicators(data_path: os.PathLike):
+def _read_country_summaries_report(data_path: os.PathLike) -> pd.DataFrame:
     """
-    Function to load the country summaries indicators
+    Function to read a country report from its parquet copy, written by the OHCHR results
+    generation, or from the Excel file if the parquet file is missing, older than the Excel file
+    or cannot be read.
     """
-    country_summaries_dataset = pd.read_excel(data_path).ffill()
-    country_summaries_dataset["Formatted Submitted Date"] = country_summaries_dataset[
-        "Submitted Date"
-    ].apply(_convert_to_datetime)
+    parquet_path = f"{os.path.splitext(data_path)[0]}.parquet"
+    parquet_is_up_to_date = os.path.exists(parquet_path) and (
+        os.path.getmtime(parquet_path) >= os.path.getmtime(data_path)
+    )
+    if parquet_is_up_to_date:
+        try:
+            return pd.read_parquet(parquet_path)
+        except (OSError, ValueError):
+            pass
+
+    return pd.read_excel(data_path).ffill()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_country_summaries_indicators(
+    data_path: os.PathLike, last_modified_time: float
+):
+    """
+    Function to load the country summaries indicators and the box color of each indicator,
+    cached across sessions.
+    """
+    country_summaries_dataset = _read_country_summaries_report(data_path)
+    # Parsed in one vectorized call, the documents without a date ("-") get NaT
+    country_summaries_dataset["Formatted Submitted Date"] = pd.to_datetime(
+        country_summaries_dataset["Submitted Date"], format="%d %b %Y", errors="coerce"
+    )
     displayed_indicators = country_summaries_dataset.Tag.unique()
-    return country_summaries_dataset, displayed_indicators
+    # Box color of each indicator, from the laws summary of its first row
+    first_indicator_rows = country_summaries_dataset.drop_duplicates("Indicator")
+    indicators_colors = {
+        indicator: _get_color(laws_summary)
+        for indicator, laws_summary in zip(
+            first_indicator_rows["Indicator"], first_indicator_rows["Laws Summary"]
+        )
+    }
+    # Indexed by indicator and sorted, so the detailed results of an indicator are a sorted index
+    # lookup. The stable sort keeps the order of the documents of each indicator.
+    country_summaries_dataset = (
+        country_summaries_dataset.set_index("Indicator", drop=False)
+        .rename_axis(index=None)
+        .sort_index(kind="stable")
+    )
+    return country_summaries_dataset, displayed_indicators, indicators_colors
 
 
 def _display_legend_box(
@@ -188,28 +227,23 @@ def _get_color(input_text: str) -> str:
     return displayed_color
 
 
-def _display_one_box_results(country_summaries_dataset, one_indicator):
+def _display_one_box_results(indicators_colors: Dict[str, str], one_indicator: str):
     """
-    Displays results for a single indicator box based on provided country summaries dataset.
+    Displays results for a single indicator box based on the colors computed when loading
+    the country summaries dataset.
 
     Args:
-    - country_summaries_dataset (pd.DataFrame): DataFrame containing country summaries data.
+    - indicators_colors (Dict[str, str]): Box color of each indicator of the country summaries dataset.
     - one_indicator (str): Indicator tag to display results for.
 
     Operation:
-    1. Checks if `one_indicator` exists in `displayed_indicators`.
-    2. Retrieves the summary of `one_indicator` from `country_summaries_dataset`.
-    3. Checks if the summary contains keywords such as 'law', 'article', or 'decree'
-       to determine the indicator box color using `_display_indicator_box`.
-    4. If `one_indicator` is not in `displayed_indicators`, displays the indicator
-       box with a color indicating 'NOT AVAILABLE'.
+    1. Looks up the color of `one_indicator` in `indicators_colors`, computed from its laws summary
+       with `_get_color` when loading the data.
+    2. If `one_indicator` is not in `indicators_colors`, uses the color indicating 'NOT AVAILABLE'.
+    3. Displays the indicator box with the color using `_display_indicator_box`.
 
     """
-    one_indicator_results = country_summaries_dataset[
-        country_summaries_dataset["Indicator"] == one_indicator
-    ]["Laws Summary"].values[0]
-
-    displayed_color = _get_color(one_indicator_results)
+    displayed_color = indicators_colors.get(one_indicator, no_info_color)
 
     _display_indicator_box(one_indicator.replace("Chid", "Child"), displayed_color)
 
@@ -229,7 +263,7 @@ def _display_one_box_results(country_summaries_dataset, one_indicator):
 
 
 def _display_legal_framework_indicator_boxes(
-    country_summaries_dataset: pd.DataFrame,
+    indicators_colors: Dict[str, str],
     selected_country: str,
     display_all_tags: bool = True,
 ):
@@ -238,7 +272,7 @@ def _display_legal_framework_indicator_boxes(
     on provided country summaries dataset.
 
     Args:
-    - country_summaries_dataset (pd.DataFrame): DataFrame containing country summaries data.
+    - indicators_colors (Dict[str, str]): Box color of each indicator of the country summaries dataset.
     - displayed_indicators (list[str]): List of indicators to display within the legal framework boxes.
     - display_all_tags (bool, optional): Flag indicating whether to display all legal framework
       tags or only specific ones. Default is True.
@@ -315,7 +349,7 @@ def _display_legal_framework_indicator_boxes(
                 nb = (2 * indicator_id) % 12
                 with shown_columns[nb].container():
                     _display_one_box_results(
-                        country_summaries_dataset,
+                        indicators_colors,
                         one_indicator,
                     )
 
@@ -327,52 +361,50 @@ def _display_results_one_indicator(
     Displays results for a specific indicator in a country summaries dataset.
 
     Args:
-    - country_summaries_datset (pd.DataFrame): DataFrame containing country summaries data.
+    - country_summaries_datset (pd.DataFrame): DataFrame containing country summaries data,
+      indexed and sorted by 'Indicator'.
     - one_indicator (str): Specific indicator tag to display results for.
 
     Operation:
-    1. Filters the `country_summaries_datset` DataFrame to retrieve entries matching the `one_indicator`.
-    2. Sorts the filtered DataFrame based on the 'Formatted Submitted Date' in descending order.
-    3. Retrieves the summary of the most recent entry for the specified indicator.
-    4. Retrieves relevant details such as text snippets, document title,
+    1. Looks up the entries matching the `one_indicator` in the sorted 'Indicator' index of the
+       `country_summaries_datset` DataFrame. If there is none, displays the indicator as not available.
+    2. Retrieves the summary of the first entry for the specified indicator.
+    3. Retrieves relevant details such as document title,
        publishing date, and URL for articles related to the indicator.
-    5. Displays a custom title for the indicator section.
-    6. Displays the summary of the most recent entry in one column and lists relevant articles
-       with their titles, dates, and URLs in another column.
+    4. Displays a custom title for the indicator section.
+    5. Displays the summary of the first entry in one column and lists relevant articles
+       with their titles, dates, and URLs in another column, built in a single markdown text.
     """
-    df_one_indicator = country_summaries_datset[
-        country_summaries_datset["Indicator"] == one_indicator
-    ]  # .sort_values("Formatted Submitted Date", ascending=False)
-
-    one_indicator_summary = df_one_indicator["General Summary"].values[0]
+    shown_indicator = one_indicator.replace("Chid", "Child")
+    if one_indicator not in country_summaries_datset.index:
+        _display_bullet_point_as_highlighted_text(shown_indicator, no_info_color)
+        st.markdown("No information extracted for this indicator.")
+        return
 
-    one_indicator_relevant_text = df_one_indicator["Extracted Infos"]
-    one_indicator_doc_title = df_one_indicator["Title"]
-    one_indicator_publishing_date = df_one_indicator["Submitted Date"]
-    one_indicator_url = df_one_indicator["doc_link"]
-    n_articles = len(one_indicator_relevant_text)
+    # List of one label, so the lookup always returns a DataFrame
+    df_one_indicator = country_summaries_datset.loc[[one_indicator]]
 
-    laws_summary = df_one_indicator["Laws Summary"].values
-    if len(laws_summary) == 0:
-        color = no_info_color
-    else:
-        color = _get_color(laws_summary[0])
+    one_indicator_summary = df_one_indicator["General Summary"].iat[0]
+    color = _get_color(df_one_indicator["Laws Summary"].iat[0])
 
-    _display_bullet_point_as_highlighted_text(
-        one_indicator.replace("Chid", "Child"), color
-    )
-    if one_indicator_doc_title.iloc[0] == "-":
+    _display_bullet_point_as_highlighted_text(shown_indicator, color)
+    if df_one_indicator["Title"].iat[0] == "-":
         st.markdown("No information extracted for this indicator.")
     else:
+        articles_text = "\n\n".join(
+            f"[{doc_title}]({url}) ({publishing_date})"
+            for doc_title, url, publishing_date in zip(
+                df_one_indicator["Title"],
+                df_one_indicator["doc_link"],
+                df_one_indicator["Submitted Date"],
+            )
+        )
         summary_col, _, original_doc_col = st.columns([0.65, 0.02, 0.33])
         with summary_col:
             st.markdown(one_indicator_summary)
         with original_doc_col:
             with st.container(height=200):
-                for i in range(n_articles):
-                    st.markdown(
-                        f"""[{one_indicator_doc_title.iloc[i]}]({one_indicator_url.iloc[i]}) ({one_indicator_publishing_date.iloc[i]})"""  # noqa
-                    )
+                st.markdown(articles_text)
 
 
 @st.fragment
@@ -387,8 +419,10 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
     1. Checks if the path to the legal framework report for the selected country exists in the session state.
     2. Constructs the path to the legal framework report if it does not exist.
     3. If the legal framework report does not exist, displays a custom title indicating no information available and returns.
-    4. Checks if the country summaries dataset and displayed indicators are loaded in the session state.
-    5. Loads the country summaries dataset and displayed indicators from the legal framework report if not already loaded.
+    4. Loads the country summaries dataset and displayed indicators from the legal framework report,
+       with the loader cached across sessions and keyed on the report modification time.
+    5. Computes the last update date of the report from its parsed submission dates,
+       if it is not already in the session state.
     6. Sets up a Streamlit container and displays legal framework indicator boxes
        using `_display_legal_framework_indicator_boxes`.
     7. If `display_detailed_results` is True, displays detailed results for each displayed indicator
@@ -421,32 +455,26 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
         )
         return
 
-    if f"country_summaries_dataset_{selected_country}" not in st.session_state:
-        country_summaries_dataset, displayed_indicators = (
-            _load_country_summaries_indicators(
-                st.session_state[
-                    f"legal_framework_summaries_country_path_{selected_country}"
-                ]
-            )
-        )
-        st.session_state[f"country_summaries_dataset_{selected_country}"] = (
-            country_summaries_dataset
+    legal_framework_summaries_country_path = st.session_state[
+        f"legal_framework_summaries_country_path_{selected_country}"
+    ]
+    country_summaries_dataset, displayed_indicators, indicators_colors = (
+        _load_country_summaries_indicators(
+            legal_framework_summaries_country_path,
+            os.path.getmtime(legal_framework_summaries_country_path),
         )
+    )
 
+    if f"date_ohchr_{selected_country}" not in st.session_state:
         st.session_state[f"date_ohchr_{selected_country}"] = (
-            pd.to_datetime(
-                country_summaries_dataset[
-                    country_summaries_dataset["Submitted Date"] != "-"
-                ]["Submitted Date"],
-                format="%d %b %Y",
-            )
+            country_summaries_dataset["Formatted Submitted Date"]
             .max()
             .strftime("%b %Y")
         )
 
     with st.container():
         _display_legal_framework_indicator_boxes(
-            st.session_state[f"country_summaries_dataset_{selected_country}"],
+            indicators_colors,
             selected_country,
             display_all_tags=display_detailed_results,
         )
@@ -468,6 +496,6 @@ def country_wise_legal_framework(selected_country: str, display_detailed_results
 
             for one_indicator in tag_indicators:
                 _display_results_one_indicator(
-                    st.session_state[f"country_summaries_dataset_{selected_country}"],
+                    country_summaries_dataset,
                     one_indicator,
                 )
@@ -130,8 +130,8 @@ def _get_unicef_global_db_5_14_mortality_rate_df():
 
     # def _read_preprocess_one_df(sheet_name: str) -> pd.DataFrame:
     df = pd.read_excel(df_path, sheet_name=sheet_name, header=14).iloc[:-2]
-    df["Country.Name"] = df["Country.Name"].apply(
-        lambda x: unicef_countries_mapping.get(x, x)
+    df["Country.Name"] = (
+        df["Country.Name"].map(unicef_countries_mapping).fillna(df["Country.Name"])
     )
     df = df[
         (df["Uncertainty.Bounds*"] == "Median")
@@ -140,19 +140,23 @@ def _get_unicef_global_db_5_14_mortality_rate_df():
     number_associated_cols = [col for col in df.columns if _str_contains_digit(col)]
     df = df[["Country.Name", "Uncertainty.Bounds*"] + number_associated_cols]
 
-    final_df = pd.DataFrame()
+    # Rows collected in a list and the DataFrame built once, appending to it copies it every time
+    final_rows = []
     for i, row in df.iterrows():
         for col in number_associated_cols:
-            final_df = final_df._append(
+            final_rows.append(
                 {
                     "Geographic area": row["Country.Name"],
                     "Indicator": "Mortality rate age 5-14",
                     "OBS_VALUE": row[col],
                     "TIME_PERIOD": col.split(".")[0],
                     "SEX": "_T",
-                },
-                ignore_index=True,
+                }
             )
+    final_df = pd.DataFrame.from_records(
+        final_rows,
+        columns=["Geographic area", "Indicator", "OBS_VALUE", "TIME_PERIOD", "SEX"],
+    )
 
     return final_df
 
@@ -288,7 +292,7 @@ def _show_one_number_results(df: pd.DataFrame, title: str):
             continue
 
         elif len(df_one_sex) == 1:
-            value = round(df_one_sex["OBS_VALUE"].values[0], 1)
+            value = round(df_one_sex["OBS_VALUE"].iat[0], 1)
             # shown_string += f"{shown_sex_name}: "
             if one_sex == "_T":
                 shown_string += f"{value}% ("
@@ -339,7 +343,7 @@ def _show_one_number_results(df: pd.DataFrame, title: str):
             st.plotly_chart(fig, use_container_width=True)
 
     if years_counts == 1:
-        date = df["TIME_PERIOD"].values[0]
+        date = df["TIME_PERIOD"].iat[0]
         _custom_font(title, shown_string, date)
         # shown_text = f"- **{title}**: {shown_string}"
         # st.markdown(shown_text, unsafe_allow_html=True)
@@ -575,11 +579,10 @@ def _create_mortality_rate_viz(original_df: pd.DataFrame):
     - original_df (pd.DataFrame): Original DataFrame containing mortality rate data.
 
     Operation:
-    1. Copies the original DataFrame 'original_df' into 'df' for manipulation.
+    1. Uses 'original_df' as 'df' without copying it, it is only filtered and never modified.
     2. Defines indicators dictionary mapping mortality rate indicators to abbreviated labels for visualization.
-    3. Initializes an empty DataFrame 'one_country_mortality_rate' to store filtered data for one country.
-    4. Iterates over each indicator in 'indicators' dictionary, appending filtered data
-       from 'df' where 'Indicator' matches the current indicator.
+    3. Filters 'df' for each indicator in 'indicators' dictionary, where 'Indicator' matches the indicator.
+    4. Concatenates the filtered data of all the indicators once into 'one_country_mortality_rate'.
     5. Replaces full indicator names with abbreviated labels in 'one_country_mortality_rate'.
     6. Sets custom colors for the bar plot visualization.
     7. Uses Plotly Express 'px.bar' to create a grouped bar plot ('barmode="group"') with
@@ -593,7 +596,7 @@ def _create_mortality_rate_viz(original_df: pd.DataFrame):
     - None
     """
 
-    df = original_df.copy()
+    df = original_df
 
     _custom_title(
         "Consequences for Children's Protection",
@@ -608,14 +611,12 @@ def _create_mortality_rate_viz(original_df: pd.DataFrame):
         "Mortality rate age 15-19": "15-19",
     }
 
-    one_country_mortality_rate = pd.DataFrame()
-    for indicator in indicators:
-        one_country_mortality_rate = one_country_mortality_rate._append(
-            df[df["Indicator"] == indicator]
-        )
-        one_country_mortality_rate["Indicator"] = one_country_mortality_rate[
-            "Indicator"
-        ].replace(indicators)
+    one_country_mortality_rate = pd.concat(
+        [df[df["Indicator"] == indicator] for indicator in indicators]
+    )
+    one_country_mortality_rate["Indicator"] = one_country_mortality_rate[
+        "Indicator"
+    ].replace(indicators)
 
     # one_country_mortality_rate.sort_values(by="Indicator", ascending=True, inplace=True)
 
@@ -1,5 +1,5 @@
 import os
-from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
 import pandas as pd
@@ -17,13 +17,6 @@ def _load_countries_list():
     ).country.tolist()
 
 
-def _convert_to_datetime(date_str: str):
-    """
-    Function to convert a string date to a datetime object
-    """
-    return datetime.strptime(date_str, "%d %b %Y") if date_str != "-" else "-"
-
-
 def _flatten_list_of_lists(list_of_lists: List[List[str]]) -> List[str]:
     """
     Function to flatten a list of lists
@@ -31,6 +24,7 @@ def _flatten_list_of_lists(list_of_lists: List[List[str]]) -> List[str]:
     return [item for sublist in list_of_lists for item in sublist]
 
 
+@lru_cache(maxsize=4096, typed=True)
 def _add_commas(number: int):
     """
     Function to add commas to a number
@@ -77,6 +71,14 @@ def _load_protection_indicators_data(selected_country: str):
                 .max()
                 .strftime("%m-%Y")
             )
+            # Rows of each breakdown, split once so the displays do not scan the whole dataframe
+            st.session_state[f"protection_df_by_breakdown_{selected_country}"] = dict(
+                tuple(
+                    st.session_state[f"protection_df_{selected_country}"].groupby(
+                        "Breakdown Column", sort=False
+                    )
+                )
+            )
         else:
             st.session_state[f"protection_df_{selected_country}"] = pd.DataFrame(
                 columns=[
@@ -91,6 +93,19 @@ def _load_protection_indicators_data(selected_country: str):
             )
             st.session_state[f"possible_breakdowns_{selected_country}"] = []
             st.session_state[f"protection_df_max_date_{selected_country}"] = "-"
+            st.session_state[f"protection_df_by_breakdown_{selected_country}"] = {}
+
+
+def _get_protection_breakdown_df(selected_country: str, breakdown: str) -> pd.DataFrame:
+    """
+    Function to get the protection data rows of one breakdown, or an empty dataframe if there are none
+    """
+    protection_df_by_breakdown = st.session_state[
+        f"protection_df_by_breakdown_{selected_country}"
+    ]
+    if breakdown in protection_df_by_breakdown:
+        return protection_df_by_breakdown[breakdown]
+    return st.session_state[f"protection_df_{selected_country}"].iloc[0:0]
 
 
 def _country_selection_filter(filter_name: str, country_index: Optional[int] = None):
@@ -130,13 +145,41 @@ def _show_header(text: str):
     # return selected_country
 
 
+title_separator = "**************************************************************"
+
+
+def _get_source_html(source: str, margin_bottom: int) -> str:
+    """
+    Function to get the HTML markup of a source text.
+    """
+    return f"""<div style="margin-top: {-5}px; margin-bottom: {10 + margin_bottom}px; font-size: {14}px; color: black"> {source} </div>"""  # noqa
+
+
 def _add_source(source: str, margin_bottom: int):
     st.markdown(
-        f"""<div style="margin-top: {-5}px; margin-bottom: {10 + margin_bottom}px; font-size: {14}px; color: black"> {source} </div>""",  # noqa
+        _get_source_html(source, margin_bottom),
         unsafe_allow_html=True,
     )
 
 
+def _get_title_html(title: str, font_size: int = 20, margin_top: int = 0) -> str:
+    """
+    Function to get the HTML markup of a custom title, large titles (font size 30) are uppercase and gray.
+    """
+    if font_size == 30:
+        text_transform = "text-transform: uppercase;"
+        text_color = "color: dimgray;"
+    else:
+        text_transform = ""
+        text_color = "color: black;"
+
+    return f"""
+    <div style="margin-top: {margin_top}px; margin-bottom: 0px; font-size: {font_size}px; {text_color} font-weight: bold; {text_transform}">
+        {title}
+    </div>
+    """
+
+
 def _custom_title(
     title: str,
     font_size: int = 20,
@@ -150,26 +193,16 @@ def _custom_title(
     Function to display a custom title with a source and a date and additional text if provided.
     """
     is_large_font = font_size == 30
-    if is_large_font:
-        text_transform = "text-transform: uppercase;"
-        text_color = "color: dimgray;"
-    else:
-        text_transform = ""
-        text_color = "color: black;"
 
     if is_large_font:
-        st.markdown("**************************************************************")
+        st.markdown(title_separator)
 
     st.markdown(
-        f"""
-    <div style="margin-top: {margin_top}px; margin-bottom: 0px; font-size: {font_size}px; {text_color} font-weight: bold; {text_transform}">
-        {title}
-    </div>
-    """,
+        _get_title_html(title, font_size, margin_top),
         unsafe_allow_html=True,
     )
     if is_large_font:
-        st.markdown("**************************************************************")
+        st.markdown(title_separator)
 
     txt = ""
     if source:
@@ -190,6 +223,7 @@ def _show_logo():
     )
 
 
+@lru_cache(maxsize=4096, typed=True)
 def _get_percentage(number):
     return f"{round(number*100)}%"
 
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from io import BytesIO
 from typing import Tuple
 
 import matplotlib.pyplot as plt
@@ -5,18 +7,27 @@ import pandas as pd
 import streamlit as st
 from frontend.src.utils.utils_functions import _add_source
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
 
 
+# (threshold, suffix, number of decimals) used to abbreviate numbers, largest first
+abbreviation_thresholds = ((1_000_000, " million", 1), (1_000, " k", 0))
+
+
+# Typed cache, so an int and the equal float are formatted separately
+@lru_cache(maxsize=4096, typed=True)
 def _get_abbreviated_number(number: int) -> str:
     """
     Abbreviate a number to a more readable format.
+    The results are cached, as the same numbers are formatted at every rerun.
     """
-    if number < 1000:
-        return str(number)
-    elif number < 1000000:
-        return str(int(number / 1_000)) + " k"
-    else:
-        return str(round(number / 1_000_000, 1)) + " million"
+    for threshold, suffix, n_decimals in abbreviation_thresholds:
+        if number >= threshold:
+            scaled_number = number / threshold
+            if n_decimals:
+                return f"{round(scaled_number, n_decimals)}{suffix}"
+            return f"{int(scaled_number)}{suffix}"
+    return str(number)
 
 
 @st.fragment
@@ -309,6 +320,56 @@ def _add_plot_legend(
 #     st.pyplot(fig, bbox_inches="tight", pad_inches=0.1)
 
 
+@st.cache_data(show_spinner=False, max_entries=200)
+def _get_horizontal_continous_scale_barplot_image(
+    labels: Tuple[str],
+    scores: Tuple[float],
+    shown_score_values: Tuple[str],
+    max_val: int,
+    color1: str,
+    color2: str,
+    title: str,
+    x_ax_title: str,
+    y_ax_title: str,
+    figsize: Tuple[int],
+) -> bytes:
+    """
+    Builds the figure of '_create_horizontal_continous_scale_barplot' and returns it as PNG bytes.
+    The image is cached, so the figure is only built once for the same values, and sessions
+    share immutable bytes instead of a matplotlib figure.
+    It is created outside of pyplot so the figures are not kept in the pyplot figures registry.
+    """
+    custom_cmap = create_continuous_cmap([color1, color2])
+
+    norm = plt.Normalize(0, max_val)
+
+    # Create the figure and axes
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+
+    # Create the bars
+    for i, score in enumerate(scores):
+        color = custom_cmap(norm(score))
+        ax.barh(i, score, color=color, edgecolor="white", linewidth=1.2, height=0.4)
+
+    _customize_axes_horizontal_plot(ax, labels, max_val)
+
+    # # Add colorbar
+    # cbar = plt.colorbar(sm, ax=ax, orientation="horizontal", fraction=0.1, pad=0.04)
+    # # cbar.set_label("Value", fontsize=10)
+    # cbar.outline.set_edgecolor("white")
+
+    # Add the scores as text
+    _add_scores_text_horizontal_plot(ax, scores, shown_score_values)
+
+    _add_plot_legend(ax, title, x_ax_title, y_ax_title)
+
+    # Same options as st.pyplot
+    image = BytesIO()
+    fig.savefig(image, format="png", dpi=200, bbox_inches="tight", pad_inches=0.1)
+    return image.getvalue()
+
+
 @st.fragment
 def _create_horizontal_continous_scale_barplot(
     df: pd.DataFrame,
@@ -340,38 +401,24 @@ def _create_horizontal_continous_scale_barplot(
 
     Returns:
     None
-    """
-    custom_cmap = create_continuous_cmap([color1, color2])
-
-    norm = plt.Normalize(0, max_val)
-    sm = plt.cm.ScalarMappable(cmap=custom_cmap, norm=norm)
-    sm.set_array([])
-
-    scores = df[numbers_col].values
-    labels = df[labels_col].values
-    shown_score_values = df[text_col].values
-
-    # Create the figure and axes
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Create the bars
-    for i, (label, score) in enumerate(zip(labels, scores)):
-        color = custom_cmap(norm(score))
-        ax.barh(i, score, color=color, edgecolor="white", linewidth=1.2, height=0.4)
-
-    _customize_axes_horizontal_plot(ax, labels, max_val)
-
-    # # Add colorbar
-    # cbar = plt.colorbar(sm, ax=ax, orientation="horizontal", fraction=0.1, pad=0.04)
-    # # cbar.set_label("Value", fontsize=10)
-    # cbar.outline.set_edgecolor("white")
-
-    # Add the scores as text
-    _add_scores_text_horizontal_plot(ax, scores, shown_score_values)
 
-    _add_plot_legend(ax, title, x_ax_title, y_ax_title)
+    The figure is built by the cached '_get_horizontal_continous_scale_barplot_image',
+    so reruns with the same values do not rebuild it.
+    """
+    image = _get_horizontal_continous_scale_barplot_image(
+        tuple(df[labels_col].tolist()),
+        tuple(df[numbers_col].tolist()),
+        tuple(df[text_col].tolist()),
+        max_val,
+        color1,
+        color2,
+        title,
+        x_ax_title,
+        y_ax_title,
+        tuple(figsize),
+    )
 
-    st.pyplot(fig, bbox_inches="tight", pad_inches=0.1)
+    st.image(image, use_container_width=True)
 
     max_val = int(max_val)
     if max_val == 5:
@@ -3,7 +3,7 @@ from typing import Dict, List, Literal
 import pandas as pd
 import pydeck as pdk
 import streamlit as st
-from frontend.src.utils.load_geodata import _load_polygons_adm1
+from frontend.src.utils.load_geodata import _load_polygons_adm0, _load_polygons_adm1
 
 lat_range = 180
 lon_range = 360
@@ -26,6 +26,71 @@ severity_mapping_tag_name_to_color_main_countries = {
 }
 
 
+# INFORM Severity columns shown in the countries legend, with their displayed names
+inform_severity_legend_columns = {
+    "INFORM Severity category name": "Situation Severity",
+    "DRIVERS": "Drivers",
+    "Trend (last 3 months)": "Trend (last 3 months)",
+    "Last updated": "Last updated",
+}
+
+
+def _get_country_color_and_legend(country_name: str, one_country_values: Dict[str, str]):
+    """
+    Returns the fill color and the legend of one country polygon from its INFORM Severity values.
+    """
+    inform_index_properties = one_country_values["Situation Severity"]
+    if inform_index_properties != "x":
+        fill_color = severity_mapping_tag_name_to_color_main_countries[
+            inform_index_properties
+        ]
+    else:
+        fill_color = default_filling_color
+    legend = f" -- {country_name} --\n" + "\n".join(
+        f"{key}: {value if value != 'x' else 'UNKNOWN'}"
+        for key, value in one_country_values.items()
+    )
+    return fill_color, legend
+
+
+@st.cache_resource(show_spinner=False)
+def _build_colored_polygons(inform_severity_df: pd.DataFrame):
+    """
+    Loads the countries polygons and adds the INFORM Severity fill color and legend to each of them.
+    The colors and legends are computed once per country, and a new GeoJSON object is returned so that
+    the loaded polygons are never mutated. The result is shared across sessions and reruns.
+    """
+    geojson_country_polygons = _load_polygons_adm0()
+
+    inform_severity_values = (
+        inform_severity_df[["COUNTRY"] + list(inform_severity_legend_columns)]
+        .rename(columns=inform_severity_legend_columns)
+        .drop_duplicates(subset="COUNTRY", keep="last")
+        .set_index("COUNTRY")
+        .to_dict("index")
+    )
+    countries_colors_and_legends = {
+        country_name: _get_country_color_and_legend(country_name, one_country_values)
+        for country_name, one_country_values in inform_severity_values.items()
+    }
+
+    colored_features = []
+    for feature in geojson_country_polygons["features"]:
+        country_name = feature["properties"]["name"]
+        fill_color, legend = countries_colors_and_legends.get(
+            country_name, ([255, 255, 255], f"Country: {country_name}")
+        )
+        colored_features.append(
+            {
+                **feature,
+                "properties": {**feature["properties"], "fill_color": fill_color},
+                "legend": legend,
+            }
+        )
+
+    return {**geojson_country_polygons, "features": colored_features}
+
+
 def _get_mean(data: List[float]):
     return sum(data) / len(data)
 
@@ -289,8 +354,7 @@ def _display_map_img(displayed_df: pd.DataFrame, country_name: str):
     5. Calls `_create_points_map_placeholder_pdk` to display a map using the PolyDeck (PDK) library,
        showing administrative regions and their aggregated data.
     """
-    count_df = displayed_df.copy()
-    count_df = count_df.groupby("admin1", as_index=False).agg(
+    count_df = displayed_df.groupby("admin1", as_index=False).agg(
         {"event_date": "count", "fatalities": "sum"}
     )
     # st.dataframe(displayed_df)